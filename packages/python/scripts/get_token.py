@@ -13,11 +13,12 @@ The script will:
 3. Save credentials to ~/.google-slides-mcp/credentials.json
 """
 
-import json
+import functools
 import os
 import sys
 from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
 from google_auth_oauthlib.flow import InstalledAppFlow
 
@@ -32,9 +33,18 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive",  # Full access for search + copy/convert
 ]
 
-# Default credentials storage location
-CREDENTIALS_DIR = Path(os.path.expanduser("~/.google-slides-mcp"))
-CREDENTIALS_FILE = CREDENTIALS_DIR / "credentials.json"
+
+# Credentials locations mirror google_slides_mcp.auth.paths. They are not
+# imported from there because importing the package loads the whole server.
+@functools.cache
+def credentials_dir() -> Path:
+    """Root directory for locally stored credentials, resolved on first use."""
+    return Path("~/.google-slides-mcp").expanduser()
+
+
+def credentials_file() -> Path:
+    """OAuth credentials file read by the server for stdio transport."""
+    return credentials_dir() / "credentials.json"
 
 
 def get_client_config() -> dict:
@@ -90,22 +100,26 @@ def run_oauth_flow() -> dict:
 
 def save_credentials(credentials: dict) -> Path:
     """Save credentials to the credentials file."""
-    CREDENTIALS_DIR.mkdir(parents=True, exist_ok=True)
-
-    with open(CREDENTIALS_FILE, "w") as f:
-        json.dump(credentials, f, indent=2)
+    credentials_dir().mkdir(parents=True, exist_ok=True)
+    path = credentials_file()
 
-    # Restrict file permissions (owner read/write only)
-    os.chmod(CREDENTIALS_FILE, 0o600)
+    # Written in one call to an owner-only temporary file, then renamed over
+    # the target so a crash never leaves a truncated credentials file
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(orjson.dumps(credentials, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
 
-    return CREDENTIALS_FILE
+    return path
 
 
 def main():
     """Main entry point."""
     # Check if credentials already exist
-    if CREDENTIALS_FILE.exists():
-        print(f"Existing credentials found at: {CREDENTIALS_FILE}")
+    existing = credentials_file()
+    if existing.exists():
+        print(f"Existing credentials found at: {existing}")
         response = input("Do you want to replace them? [y/N]: ").strip().lower()
         if response != "y":
             print("Aborted.")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Generate the trimmed Drive v3 discovery document shipped with the package.
+
+DriveService only calls four Drive methods, so instead of parsing the full
+~200 KB discovery document on cold start it loads a trimmed copy that keeps
+just those methods and the schemas they reference.
+
+Usage:
+    python scripts/trim_drive_discovery.py [SOURCE]
+
+SOURCE may be a path or URL to the Drive v3 discovery document. By default
+the copy bundled with google-api-python-client is used; pass
+https://www.googleapis.com/discovery/v1/apis/drive/v3/rest to fetch the
+latest revision instead.
+"""
+
+import sys
+import urllib.request
+from pathlib import Path
+
+import googleapiclient
+import orjson
+
+# Drive methods used by DriveService
+METHODS = ("copy", "get", "export", "list")
+
+# Top-level discovery keys needed by googleapiclient.discovery.build_from_document
+TOP_LEVEL_KEYS = (
+    "kind",
+    "discoveryVersion",
+    "id",
+    "name",
+    "version",
+    "revision",
+    "protocol",
+    "rootUrl",
+    "mtlsRootUrl",
+    "servicePath",
+    "basePath",
+    "baseUrl",
+    "batchPath",
+    "parameters",
+    "auth",
+)
+
+BUNDLED_DOCUMENT = (
+    Path(googleapiclient.__file__).parent / "discovery_cache" / "documents" / "drive.v3.json"
+)
+OUTPUT_FILE = (
+    Path(__file__).resolve().parent.parent
+    / "src"
+    / "google_slides_mcp"
+    / "data"
+    / "drive_v3_min.json"
+)
+
+
+def load_document(source: str | None) -> dict:
+    """Load the full discovery document from a path or URL."""
+    if source is None:
+        return orjson.loads(BUNDLED_DOCUMENT.read_bytes())
+    if source.startswith(("http://", "https://")):
+        with urllib.request.urlopen(source) as response:
+            return orjson.loads(response.read())
+    return orjson.loads(Path(source).read_bytes())
+
+
+def strip_descriptions(value: object) -> object:
+    """Recursively drop human-readable descriptions, which build() does not need."""
+    if isinstance(value, dict):
+        return {
+            key: strip_descriptions(item)
+            for key, item in value.items()
+            if key not in ("description", "enumDescriptions")
+        }
+    if isinstance(value, list):
+        return [strip_descriptions(item) for item in value]
+    return value
+
+
+def collect_refs(value: object, schemas: dict, found: set[str]) -> None:
+    """Collect the names of all schemas transitively referenced by value."""
+    if isinstance(value, dict):
+        ref = value.get("$ref")
+        if isinstance(ref, str) and ref not in found:
+            found.add(ref)
+            collect_refs(schemas[ref], schemas, found)
+        for item in value.values():
+            collect_refs(item, schemas, found)
+    elif isinstance(value, list):
+        for item in value:
+            collect_refs(item, schemas, found)
+
+
+def trim(document: dict) -> dict:
+    """Reduce the discovery document to the methods used by DriveService."""
+    methods = document["resources"]["files"]["methods"]
+    kept_methods = {name: methods[name] for name in METHODS}
+
+    referenced: set[str] = set()
+    collect_refs(kept_methods, document["schemas"], referenced)
+
+    trimmed = {key: document[key] for key in TOP_LEVEL_KEYS if key in document}
+    trimmed["resources"] = {"files": {"methods": kept_methods}}
+    trimmed["schemas"] = {name: document["schemas"][name] for name in sorted(referenced)}
+    return strip_descriptions(trimmed)  # type: ignore[return-value]
+
+
+def main() -> None:
+    """Main entry point."""
+    source = sys.argv[1] if len(sys.argv) > 1 else None
+    trimmed = trim(load_document(source))
+    OUTPUT_FILE.write_bytes(orjson.dumps(trimmed, option=orjson.OPT_SORT_KEYS) + b"\n")
+    print(f"Wrote {OUTPUT_FILE} ({OUTPUT_FILE.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
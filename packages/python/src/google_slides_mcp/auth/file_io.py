@@ -0,0 +1,74 @@
+"""Non-blocking JSON file helpers for credential storage.
+
+Credential files are read and written from async code paths, so the
+blocking disk I/O is offloaded to a worker thread to keep the event loop
+free for concurrent MCP requests.
+"""
+
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+def _load(path: Path) -> Any:
+    return orjson.loads(path.read_bytes())
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def dump_json(path: Path, data: Any, pretty: bool = False) -> None:
+    """Atomically write data as JSON to a file readable by the owner only.
+
+    The payload is written to a temporary file in the same directory, which
+    mkstemp creates with 0600 permissions, then renamed over the target. A
+    crash mid-write therefore never leaves a truncated credentials file.
+
+    Args:
+        path: Path to the JSON file
+        data: JSON-serializable data to write
+        pretty: Whether to indent the output with two spaces
+    """
+    _write_atomic(path, orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+
+
+async def read_json(path: Path) -> Any:
+    """Read and parse a JSON file without blocking the event loop.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The parsed JSON document
+
+    Raises:
+        orjson.JSONDecodeError: If the file is not valid JSON
+    """
+    return await asyncio.to_thread(_load, path)
+
+
+async def write_json(path: Path, data: Any, pretty: bool = False) -> None:
+    """Atomically write data as JSON without blocking the event loop.
+
+    See dump_json for the write and permission semantics.
+
+    Args:
+        path: Path to the JSON file
+        data: JSON-serializable data to write
+        pretty: Whether to indent the output with two spaces
+    """
+    await asyncio.to_thread(dump_json, path, data, pretty)
@@ -1,19 +1,34 @@
 """Authentication middleware for validating Google OAuth tokens."""
 
-import json
-import os
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import msgspec
+from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 
+from google_slides_mcp.auth import paths
+from google_slides_mcp.auth.file_io import read_json, write_json
+from google_slides_mcp.auth.token_store import StoredCredentials
+from google_slides_mcp.services.http_client import get_http_client
+
 if TYPE_CHECKING:
     from fastmcp import Context
 
-# Default credentials storage location
-CREDENTIALS_DIR = Path(os.path.expanduser("~/.google-slides-mcp"))
-CREDENTIALS_FILE = CREDENTIALS_DIR / "credentials.json"
+
+# Shared transport for token refreshes; its requests.Session keeps the
+# connection to Google's token endpoint alive between refreshes.
+_AUTH_REQUEST: Request | None = None
+
+
+def _get_auth_request() -> Request:
+    """Get the shared transport used to refresh credentials."""
+    global _AUTH_REQUEST
+    if _AUTH_REQUEST is None:
+        _AUTH_REQUEST = Request()
+    return _AUTH_REQUEST
 
 
 class GoogleAuthMiddleware:
@@ -30,11 +45,19 @@ class GoogleAuthMiddleware:
         """Initialize the middleware.
 
         Args:
-            credentials_file: Optional path to stored credentials file
+            credentials_file: Optional path to stored credentials file;
+                defaults to the standard location, resolved on first use
         """
-        self._credentials_file = credentials_file or CREDENTIALS_FILE
+        self._credentials_file = credentials_file
         self._cached_credentials: Credentials | None = None
 
+    @property
+    def credentials_file(self) -> Path:
+        """Path of the stored credentials file, resolved on first access."""
+        if self._credentials_file is None:
+            self._credentials_file = paths.credentials_file()
+        return self._credentials_file
+
     async def extract_credentials(self, ctx: "Context") -> Credentials:
         """Extract Google credentials from the context or stored file.
 
@@ -73,52 +96,49 @@ class GoogleAuthMiddleware:
         if self._cached_credentials and self._cached_credentials.valid:
             return self._cached_credentials
 
-        if not self._credentials_file.exists():
+        if not await asyncio.to_thread(self.credentials_file.exists):
             raise ValueError(
                 f"No credentials found. Run 'python scripts/get_token.py' to authenticate.\n"
-                f"Expected credentials at: {self._credentials_file}"
+                f"Expected credentials at: {self.credentials_file}"
             )
 
         try:
-            with open(self._credentials_file) as f:
-                creds_data = json.load(f)
-        except json.JSONDecodeError as e:
+            stored = msgspec.json.decode(
+                await asyncio.to_thread(self.credentials_file.read_bytes),
+                type=StoredCredentials,
+            )
+        except msgspec.DecodeError as e:
             raise ValueError(f"Invalid credentials file: {e}") from e
 
-        # Build credentials object
-        credentials = Credentials(
-            token=creds_data.get("token"),
-            refresh_token=creds_data.get("refresh_token"),
-            token_uri=creds_data.get("token_uri", "https://oauth2.googleapis.com/token"),
-            client_id=creds_data.get("client_id"),
-            client_secret=creds_data.get("client_secret"),
-            scopes=creds_data.get("scopes"),
+        # Build credentials object (also restores the stored expiry)
+        credentials = Credentials.from_authorized_user_info(
+            msgspec.structs.asdict(stored), scopes=stored.scopes
         )
 
         # Refresh if expired
         if credentials.expired and credentials.refresh_token:
-            from google.auth.transport.requests import Request
-
-            credentials.refresh(Request())
+            credentials.refresh(_get_auth_request())
             # Update stored credentials with new token
-            await self._save_credentials(credentials, creds_data)
+            await self._save_credentials(credentials)
 
         self._cached_credentials = credentials
         return credentials
 
-    async def _save_credentials(self, credentials: Credentials, original_data: dict) -> None:
+    async def _save_credentials(self, credentials: Credentials) -> None:
         """Save updated credentials back to file.
 
+        The file is read again as a plain mapping and only the token and
+        expiry are updated, so fields the schema doesn't declare are kept.
+
         Args:
             credentials: The credentials object with updated tokens
-            original_data: Original credentials data to preserve other fields
         """
-        original_data["token"] = credentials.token
+        data = await read_json(self.credentials_file)
+        data["token"] = credentials.token
         if credentials.expiry:
-            original_data["expiry"] = credentials.expiry.isoformat()
+            data["expiry"] = credentials.expiry.isoformat()
 
-        with open(self._credentials_file, "w") as f:
-            json.dump(original_data, f, indent=2)
+        await write_json(self.credentials_file, data, pretty=True)
 
     async def validate_token(self, token: str) -> dict:
         """Validate a Google OAuth token.
@@ -132,18 +152,15 @@ class GoogleAuthMiddleware:
         Raises:
             ValueError: If token is invalid or expired
         """
-        import httpx
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://oauth2.googleapis.com/tokeninfo",
-                params={"access_token": token},
-            )
+        response = await get_http_client().get(
+            "https://oauth2.googleapis.com/tokeninfo",
+            params={"access_token": token},
+        )
 
-            if response.status_code != 200:
-                raise ValueError(f"Invalid token: {response.text}")
+        if response.status_code != 200:
+            raise ValueError(f"Invalid token: {response.text}")
 
-            return response.json()
+        return response.json()
 
 
 # Global middleware instance for convenience
@@ -0,0 +1,25 @@
+"""Filesystem locations for locally stored credentials.
+
+Paths are resolved lazily on first use rather than at import time, so
+commands that never touch credentials skip the home-directory lookup and
+tests can point HOME elsewhere before the first call.
+"""
+
+import functools
+from pathlib import Path
+
+
+@functools.cache
+def credentials_dir() -> Path:
+    """Root directory for locally stored credentials."""
+    return Path("~/.google-slides-mcp").expanduser()
+
+
+def credentials_file() -> Path:
+    """OAuth credentials written by scripts/get_token.py (stdio transport)."""
+    return credentials_dir() / "credentials.json"
+
+
+def token_store_dir() -> Path:
+    """Directory for per-user credential files managed by FileTokenStore."""
+    return credentials_dir() / "credentials"
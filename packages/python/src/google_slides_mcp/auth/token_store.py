@@ -4,12 +4,33 @@ This module provides an abstraction for storing and retrieving OAuth
 credentials, supporting both file-based and in-memory storage.
 """
 
-import json
+import asyncio
 import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
+import msgspec
+
+from google_slides_mcp.auth.file_io import read_json, write_json
+from google_slides_mcp.auth.paths import token_store_dir
+
+
+class StoredCredentials(msgspec.Struct, kw_only=True):
+    """Schema of the authorized-user credentials file.
+
+    Matches the file written by scripts/get_token.py and read by
+    GoogleAuthMiddleware for stdio transport.
+    """
+
+    token: str
+    refresh_token: str
+    token_uri: str = "https://oauth2.googleapis.com/token"
+    client_id: str
+    client_secret: str
+    scopes: list[str] | None = None
+    expiry: str | None = None
+
 
 class TokenStore(ABC):
     """Abstract base class for token storage."""
@@ -72,6 +93,9 @@ class FileTokenStore(TokenStore):
     Each user's credentials are stored in a separate file.
     """
 
+    # Maps every non-alphanumeric ASCII character to "_" for filenames
+    _SAFE_TABLE = str.maketrans({c: "_" for c in map(chr, range(128)) if not c.isalnum()})
+
     def __init__(self, directory: str | Path | None = None) -> None:
         """Initialize file-based token store.
 
@@ -80,40 +104,35 @@ class FileTokenStore(TokenStore):
                       Defaults to ~/.google-slides-mcp/credentials
         """
         if directory is None:
-            directory = os.getenv(
-                "CREDENTIALS_DIR",
-                os.path.expanduser("~/.google-slides-mcp/credentials"),
-            )
+            directory = os.getenv("CREDENTIALS_DIR") or token_store_dir()
         self._directory = Path(directory)
         self._directory.mkdir(parents=True, exist_ok=True)
 
     def _get_path(self, user_id: str) -> Path:
         """Get the file path for a user's credentials."""
         # Sanitize user_id for use as filename
-        safe_id = "".join(c if c.isalnum() else "_" for c in user_id)
+        if user_id.isascii():
+            safe_id = user_id.translate(self._SAFE_TABLE)
+        else:
+            safe_id = "".join(c if c.isalnum() else "_" for c in user_id)
         return self._directory / f"{safe_id}.json"
 
     async def store(self, user_id: str, credentials: dict) -> None:
         """Store credentials to a file."""
-        path = self._get_path(user_id)
-        with open(path, "w") as f:
-            json.dump(credentials, f)
-        # Restrict file permissions
-        os.chmod(path, 0o600)
+        # Written atomically with owner-only permissions
+        await write_json(self._get_path(user_id), credentials)
 
     async def retrieve(self, user_id: str) -> dict | None:
         """Retrieve credentials from a file."""
         path = self._get_path(user_id)
-        if not path.exists():
+        if not await asyncio.to_thread(path.exists):
             return None
-        with open(path) as f:
-            return json.load(f)
+        return await read_json(path)
 
     async def delete(self, user_id: str) -> None:
         """Delete a credentials file."""
         path = self._get_path(user_id)
-        if path.exists():
-            path.unlink()
+        await asyncio.to_thread(path.unlink, missing_ok=True)
 
 
 def get_token_store(store_type: str = "file") -> TokenStore:
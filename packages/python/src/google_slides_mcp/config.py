@@ -3,10 +3,12 @@
 Uses pydantic-settings for environment variable loading and validation.
 """
 
+import functools
 import os
+from pathlib import Path
 from typing import Literal
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -70,10 +72,16 @@ class Settings(BaseSettings):
         description="Logging level",
     )
 
+    @field_validator("credentials_dir", mode="after")
+    @classmethod
+    def _expand_credentials_dir(cls, value: str) -> str:
+        """Expand ~ in the credentials directory once, at load time."""
+        return str(Path(value).expanduser())
+
     @property
     def credentials_path(self) -> str:
         """Get the expanded credentials directory path."""
-        return os.path.expanduser(self.credentials_dir)
+        return self.credentials_dir
 
     def has_oauth_credentials(self) -> bool:
         """Check if OAuth credentials are configured."""
@@ -87,9 +95,13 @@ class Settings(BaseSettings):
         return os.path.exists(path)
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings.
 
+    The settings are loaded once and shared; call get_settings.cache_clear()
+    to reload them from the environment.
+
     Returns:
         Settings instance with values from environment
     """
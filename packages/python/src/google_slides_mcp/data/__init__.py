@@ -0,0 +1 @@
+"""Static data files shipped with the package."""
@@ -61,7 +61,7 @@ def _build_get_started_content() -> str:
     """Build the get_started prompt content."""
     return """# Google Slides MCP Server - Getting Started
 
-This server provides **21 tools** for creating and manipulating Google Slides presentations, organized into a hierarchy from high-level semantic operations to low-level API access.
+This server provides **25 tools** for creating and manipulating Google Slides presentations, organized into a hierarchy from high-level semantic operations to low-level API access.
 
 ## Abstraction Levels
 
@@ -70,7 +70,7 @@ Work with presentations using intuitive concepts. These tools handle complexity
 
 | Category | Tools | What They Abstract |
 |----------|-------|-------------------|
-| **Templates** | copy_template, replace_placeholders, replace_placeholder_with_image, search_presentations | File operations, text replacement |
+| **Templates** | copy_template, copy_templates, replace_placeholders, replace_placeholder_with_image, replace_placeholders_with_images, search_presentations | File operations, text replacement |
 | **Content** | update_slide_content, update_presentation_content, apply_text_style | Element ID discovery, batch operations |
 | **Positioning** | position_element, align_elements, distribute_elements | EMU math, transform matrices |
 
@@ -81,6 +81,7 @@ Create new elements with sensible defaults:
 |------|---------|
 | create_slide | Add slides with layout templates |
 | add_text_box | Add text at specific position |
+| add_text_boxes | Add many text boxes in one call |
 | add_image | Add images from URLs |
 | add_shape | Add geometric shapes |
 
@@ -94,6 +95,7 @@ Inspect and understand presentations:
 | list_slides | Get slide IDs and titles |
 | get_element_info | Get element position/size in inches |
 | export_thumbnail | Generate slide preview images |
+| export_thumbnails | Generate previews for many slides at once |
 | analyze_presentation | Comprehensive style/structure analysis |
 
 ### Level 4: Low-Level API (Advanced)
@@ -142,7 +144,7 @@ def _build_tool_reference_content(
 ) -> str:
     """Build the tool_reference prompt content."""
     sections = {
-        "templates": """## Templates (4 tools)
+        "templates": """## Templates (6 tools)
 Starting point for most presentation work.
 
 ### search_presentations
@@ -167,6 +169,15 @@ copy_template(
 ```
 **Returns**: New presentation ID and URL
 
+### copy_templates
+Create several copies in one Drive batch call.
+```
+copy_templates(
+  copies: list[dict]  # Each: template_id, new_name, destination_folder_id?, convert_to_slides?
+)
+```
+**Returns**: Per-copy presentation ID and URL (or error), created and failed counts
+
 ### replace_placeholders
 Replace {{placeholder}} text globally.
 ```
@@ -186,7 +197,17 @@ replace_placeholder_with_image(
   image_url: str          # Image URL to insert
 )
 ```
-**Returns**: Number of replacements made""",
+**Returns**: Number of replacements made
+
+### replace_placeholders_with_images
+Swap many image placeholders in one update.
+```
+replace_placeholders_with_images(
+  presentation_id: str,
+  replacements: list[dict]  # Each: placeholder_text, image_url, replace_method?
+)
+```
+**Returns**: Number of shapes replaced per placeholder""",
         "content": """## Content (3 tools)
 Update text without knowing element IDs.
 
@@ -228,7 +249,7 @@ apply_text_style(
   slide_ids: list[str] | None = None  # Limit to specific slides
 )
 ```""",
-        "creation": """## Creation (4 tools)
+        "creation": """## Creation (5 tools)
 Add new elements. All positions in **inches**.
 
 ### create_slide
@@ -261,6 +282,15 @@ add_text_box(
 )
 ```
 
+### add_text_boxes
+Add several text boxes at once (one API call per 25 boxes).
+```
+add_text_boxes(
+  presentation_id: str,
+  items: list[dict]   # Each: slide_id, text, plus any add_text_box option
+)
+```
+
 ### add_image
 Add an image from a URL.
 ```
@@ -332,7 +362,7 @@ distribute_elements(
   spacing: float | Literal["even"] | None = "even"  # Fixed inches or equal spacing
 )
 ```""",
-        "utility": """## Utility (3 tools)
+        "utility": """## Utility (4 tools)
 Inspect presentations.
 
 ### list_slides
@@ -362,7 +392,18 @@ export_thumbnail(
   mime_type: Literal["PNG", "JPEG"] = "PNG"
 )
 ```
-**Returns**: Thumbnail URL (temporary)""",
+**Returns**: Thumbnail URL (temporary)
+
+### export_thumbnails
+Generate preview images for several slides concurrently.
+```
+export_thumbnails(
+  presentation_id: str,
+  slide_ids: list[str],
+  mime_type: Literal["PNG", "JPEG"] = "PNG"
+)
+```
+**Returns**: List of thumbnail URLs, in slide_ids order""",
         "analysis": """## Analysis (1 tool)
 Deep inspection of presentation structure and styling.
 
@@ -4,10 +4,100 @@ Provides a clean interface to Google Drive API operations needed for
 template copying and file management.
 """
 
+import asyncio
+import functools
+import importlib.resources
+import threading
+from collections.abc import Callable
 from typing import Any
 
-from googleapiclient.discovery import Resource, build
+import google_auth_httplib2
+import httplib2
+import orjson
+from googleapiclient.discovery import Resource, build_from_document
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+
+from google_slides_mcp.services.json_model import OrjsonModel
+from google_slides_mcp.services.retry import RATE_LIMIT_STATUSES, with_retries
+
+# Maximum number of sub-requests accepted by a single Drive batch call
+MAX_BATCH_SIZE = 100
+
+# Escapes single quotes inside Drive query string literals
+_QUERY_ESCAPE = str.maketrans({"'": "\\'"})
+
+
+@functools.cache
+def _drive_discovery_document() -> bytes:
+    """Load the trimmed Drive v3 discovery document shipped with the package.
+
+    The document only describes the files methods used by DriveService; it is
+    regenerated with scripts/trim_drive_discovery.py.
+    """
+    return (
+        importlib.resources.files("google_slides_mcp.data")
+        .joinpath("drive_v3_min.json")
+        .read_bytes()
+    )
+
+
+@functools.cache
+def _drive_resource() -> Resource:
+    """Build the Drive v3 resource once for the whole process.
+
+    Building a resource parses the Drive discovery document, so it is built
+    once and shared by every DriveService. It is not bound to any
+    credentials: each execution passes its own authorized Http object, so
+    the shared resource holds no tokens.
+
+    Returns:
+        Drive v3 API resource
+    """
+    return build_from_document(
+        orjson.loads(_drive_discovery_document()),
+        http=httplib2.Http(),
+        model=OrjsonModel(),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _build_query(
+    query: str | None,
+    mime_types: tuple[str, ...] | None,
+    folder_id: str | None,
+    include_trashed: bool,
+) -> str | None:
+    """Build a Drive files.list query string from search criteria.
+
+    Cached because pagination repeats the same criteria for every page.
+
+    Args:
+        query: Optional search query (applied to file name)
+        mime_types: MIME types to filter by
+        folder_id: Optional folder ID to search within
+        include_trashed: Whether to include trashed files
+
+    Returns:
+        The combined query string, or None if there are no clauses
+    """
+    clauses: list[str] = []
+
+    if query:
+        clauses.append(f"name contains '{query.translate(_QUERY_ESCAPE)}'")
+
+    if mime_types:
+        mime_conditions = " or ".join(f"mimeType = '{mt}'" for mt in mime_types)
+        clauses.append(f"({mime_conditions})")
+
+    if folder_id:
+        clauses.append(f"'{folder_id}' in parents")
+
+    if not include_trashed:
+        clauses.append("trashed = false")
+
+    # Combine clauses with AND
+    return " and ".join(clauses) if clauses else None
 
 
 class DriveService:
@@ -19,13 +109,81 @@ class DriveService:
         Args:
             credentials: Google OAuth credentials object
         """
-        self._service: Resource = build("drive", "v3", credentials=credentials)
+        self._credentials = credentials
+        # Per worker thread authorized Http, so connections are reused
+        self._thread_local = threading.local()
+        self._service: Resource = _drive_resource()
+        # (file_id, fields) -> (etag, metadata) for conditional get_file calls
+        self._etag_cache: dict[tuple[str, str], tuple[str, dict]] = {}
 
     @property
     def files(self) -> Resource:
         """Access the files resource."""
         return self._service.files()
 
+    async def _execute(self, request: HttpRequest) -> Any:
+        """Execute an API request in a worker thread.
+
+        The shared resource is not bound to any credentials, so the request
+        runs with the worker thread's own authorized Http object.
+
+        Args:
+            request: The prepared API request
+
+        Returns:
+            The deserialized API response
+        """
+        return await asyncio.to_thread(self._run_with_http, request.execute)
+
+    async def _execute_batch(self, requests: list[HttpRequest]) -> list[Any]:
+        """Execute API requests through the Drive batch endpoint.
+
+        Requests are sent in groups of up to MAX_BATCH_SIZE, so N requests
+        cost one HTTP round trip per group instead of one each. A failed
+        sub-request does not stop the others: every group is sent, and the
+        failure is reported in that request's slot, so the caller still sees
+        the results of requests that succeeded (e.g. copies already made).
+
+        Args:
+            requests: The prepared API requests
+
+        Returns:
+            The deserialized responses, in the same order as the requests,
+            with the HttpError in place of each failed request
+
+        Raises:
+            HttpError: If a batch call itself fails
+        """
+        results: list[Any] = [None] * len(requests)
+
+        def collect(request_id: str, response: Any, exception: HttpError | None) -> None:
+            results[int(request_id)] = response if exception is None else exception
+
+        for start in range(0, len(requests), MAX_BATCH_SIZE):
+            batch = self._service.new_batch_http_request(callback=collect)
+            group = requests[start : start + MAX_BATCH_SIZE]
+            for index, request in enumerate(group, start=start):
+                batch.add(request, request_id=str(index))
+            await asyncio.to_thread(self._run_with_http, batch.execute)
+
+        return results
+
+    def _thread_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Get the calling worker thread's authorized Http object, creating it once.
+
+        httplib2 connections are not thread-safe, so each worker thread keeps
+        its own, and reuses it (and its open connection) across calls.
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
+    def _run_with_http(self, execute: Callable[..., Any]) -> Any:
+        """Call a request's execute method with the current thread's Http."""
+        return execute(http=self._thread_http())
+
     async def copy_file(
         self,
         file_id: str,
@@ -36,7 +194,8 @@ class DriveService:
         """Copy a file to create a new file.
 
         Used for copying presentation templates. Can also convert between
-        formats by specifying a target MIME type.
+        formats by specifying a target MIME type. Rate-limited calls are
+        retried with backoff.
 
         Args:
             file_id: ID of the file to copy
@@ -58,7 +217,46 @@ class DriveService:
         if target_mime_type:
             body["mimeType"] = target_mime_type
 
-        return self.files.copy(fileId=file_id, body=body).execute()
+        request = self.files.copy(fileId=file_id, body=body)
+        # A 500 may come after the copy was made, so only retry rejections
+        return await with_retries(
+            lambda: self._execute(request),
+            statuses=RATE_LIMIT_STATUSES,
+        )
+
+    async def batch_copy_files(
+        self,
+        copies: list[dict],
+    ) -> list[dict | HttpError]:
+        """Copy several files using the Drive batch endpoint.
+
+        Copies are not retried: a failed copy is reported in its slot and
+        the rest still go ahead.
+
+        Args:
+            copies: List of copy specifications, each with:
+                - file_id: ID of the file to copy
+                - new_name: Name for the new file
+                - parent_folder_id: Optional folder ID for the copy
+                - target_mime_type: Optional target MIME type for conversion
+
+        Returns:
+            The newly created file resources, in the same order as copies,
+            with the HttpError in place of each copy that failed
+
+        Raises:
+            HttpError: If a batch call itself fails
+        """
+        requests = []
+        for copy in copies:
+            body: dict[str, Any] = {"name": copy["new_name"]}
+            if copy.get("parent_folder_id"):
+                body["parents"] = [copy["parent_folder_id"]]
+            if copy.get("target_mime_type"):
+                body["mimeType"] = copy["target_mime_type"]
+            requests.append(self.files.copy(fileId=copy["file_id"], body=body))
+
+        return await self._execute_batch(requests)
 
     async def get_file(
         self,
@@ -67,6 +265,10 @@ class DriveService:
     ) -> dict:
         """Get file metadata.
 
+        Repeated lookups send the ETag from the previous response in an
+        If-None-Match header; a 304 reply reuses the cached metadata instead
+        of downloading it again.
+
         Args:
             file_id: ID of the file
             fields: Fields to include in response
@@ -77,7 +279,34 @@ class DriveService:
         Raises:
             HttpError: If the API request fails
         """
-        return self.files.get(fileId=file_id, fields=fields).execute()
+        cache_key = (file_id, fields)
+        cached = self._etag_cache.get(cache_key)
+
+        request = self.files.get(fileId=file_id, fields=fields)
+        if cached:
+            request.headers["If-None-Match"] = cached[0]
+
+        # Capture the ETag response header, which the JSON model discards
+        etag: str | None = None
+        postproc = request.postproc
+
+        def capture_etag(resp: Any, content: Any) -> Any:
+            nonlocal etag
+            etag = resp.get("etag")
+            return postproc(resp, content)
+
+        request.postproc = capture_etag
+
+        try:
+            metadata = await self._execute(request)
+        except HttpError as e:
+            if cached and e.resp.status == 304:
+                return cached[1]
+            raise
+
+        if etag:
+            self._etag_cache[cache_key] = (etag, metadata)
+        return metadata
 
     async def export_file(
         self,
@@ -96,7 +325,7 @@ class DriveService:
         Raises:
             HttpError: If the API request fails
         """
-        return self.files.export(fileId=file_id, mimeType=mime_type).execute()
+        return await self._execute(self.files.export(fileId=file_id, mimeType=mime_type))
 
     async def list_files(
         self,
@@ -125,28 +354,12 @@ class DriveService:
         Raises:
             HttpError: If the API request fails
         """
-        # Build query clauses
-        clauses: list[str] = []
-
-        if query:
-            # Escape single quotes in the query
-            escaped_query = query.replace("'", "\\'")
-            clauses.append(f"name contains '{escaped_query}'")
-
-        if mime_types:
-            mime_conditions = " or ".join(
-                f"mimeType = '{mt}'" for mt in mime_types
-            )
-            clauses.append(f"({mime_conditions})")
-
-        if folder_id:
-            clauses.append(f"'{folder_id}' in parents")
-
-        if not include_trashed:
-            clauses.append("trashed = false")
-
-        # Combine clauses with AND
-        q = " and ".join(clauses) if clauses else None
+        q = _build_query(
+            query,
+            tuple(mime_types) if mime_types else None,
+            folder_id,
+            include_trashed,
+        )
 
         # Clamp page_size to valid range
         page_size = max(1, min(100, page_size))
@@ -161,7 +374,7 @@ class DriveService:
         if page_token:
             params["pageToken"] = page_token
 
-        return self.files.list(**params).execute()
+        return await self._execute(self.files.list(**params))
 
 
 def build_drive_service(credentials: Any) -> DriveService:
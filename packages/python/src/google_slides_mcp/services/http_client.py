@@ -0,0 +1,21 @@
+"""Shared async HTTP client for direct Google API requests.
+
+A single httpx.AsyncClient is reused for the whole process so that direct
+REST calls share a connection pool instead of opening a new TLS connection
+for every request.
+"""
+
+import httpx
+
+# Thumbnail rendering can take several seconds on large slides
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide async HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT)
+    return _CLIENT
@@ -0,0 +1,57 @@
+"""orjson-backed request/response model for googleapiclient.
+
+googleapiclient serializes request bodies and parses responses with the
+stdlib json module. Full presentations can be several MB of JSON and bulk
+updates send hundreds of nested request objects, so both directions go
+through orjson instead. Request bodies may also contain msgspec Structs
+(see utils.slides_requests), which are converted natively.
+"""
+
+import json
+from typing import Any
+
+import msgspec
+import orjson
+from googleapiclient.model import JsonModel
+
+
+class OrjsonModel(JsonModel):
+    """JsonModel that encodes and decodes with orjson."""
+
+    def serialize(self, body_value: Any) -> str:
+        """Serialize a request body to JSON.
+
+        msgspec Structs anywhere in the body are encoded with their wire
+        field names. Falls back to the stdlib encoder for values orjson
+        rejects, such as non-string dict keys or integers wider than 64 bits.
+
+        Args:
+            body_value: The request body as a Python object
+
+        Returns:
+            The body serialized as a JSON string
+        """
+        if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+            body_value = {"data": body_value}
+        try:
+            # Returned as str, which batch requests require for their payloads
+            return orjson.dumps(body_value, default=msgspec.to_builtins).decode()
+        except orjson.JSONEncodeError:
+            return json.dumps(body_value, default=msgspec.to_builtins)
+
+    def deserialize(self, content: bytes | str) -> Any:
+        """Parse a response body.
+
+        Args:
+            content: The raw response body
+
+        Returns:
+            The parsed JSON, or the content as text if it is not JSON
+        """
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
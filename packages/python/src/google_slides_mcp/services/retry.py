@@ -0,0 +1,82 @@
+"""Retry helper for transient Google API errors.
+
+Google APIs answer bursts of traffic with 429 and 503 responses, and
+occasionally fail with a 500. Rather than serializing every call to avoid
+them, calls run concurrently and retry with exponential backoff when one is
+rejected.
+"""
+
+import asyncio
+import random
+from collections.abc import Awaitable, Callable, Collection
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+
+from googleapiclient.errors import HttpError
+
+T = TypeVar("T")
+
+# Statuses returned when a request was rejected without being processed
+RATE_LIMIT_STATUSES = frozenset({429, 503})
+
+# Statuses worth retrying for requests that are safe to repeat
+RETRYABLE_STATUSES = RATE_LIMIT_STATUSES | {500}
+
+# Number of retries after the first attempt
+MAX_RETRIES = 5
+
+# Upper bound on a server-requested Retry-After delay, in seconds
+MAX_RETRY_AFTER = 60.0
+
+
+def _retry_after(error: HttpError) -> float | None:
+    """Get the delay requested by a response's Retry-After header, if any."""
+    value = error.resp.get("retry-after")
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        delay = (retry_at - datetime.now(UTC)).total_seconds()
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+
+async def with_retries(
+    call: Callable[[], Awaitable[T]],
+    max_retries: int = MAX_RETRIES,
+    statuses: Collection[int] = RETRYABLE_STATUSES,
+) -> T:
+    """Run an API call, retrying with exponential backoff on transient errors.
+
+    The n-th retry waits for the response's Retry-After delay if it sent
+    one, otherwise 2**n seconds plus up to one second of jitter.
+
+    Args:
+        call: Function returning a new awaitable for each attempt
+        max_retries: Maximum number of retries after the first attempt
+        statuses: HTTP statuses to retry; pass RATE_LIMIT_STATUSES for
+            requests that must not be repeated once the server processed them
+
+    Returns:
+        The result of the first successful attempt
+
+    Raises:
+        HttpError: If the error is not retryable or retries are exhausted
+    """
+    attempt = 0
+    while True:
+        try:
+            return await call()
+        except HttpError as e:
+            if e.resp.status not in statuses or attempt >= max_retries:
+                raise
+            delay = _retry_after(e)
+        if delay is None:
+            delay = 2**attempt + random.random()
+        await asyncio.sleep(delay)
+        attempt += 1
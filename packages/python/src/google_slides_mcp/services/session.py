@@ -0,0 +1,105 @@
+"""Per-session service construction for MCP tools.
+
+Services are memoized per access token, so consecutive tool calls in a
+session reuse the same SlidesService and DriveService instead of extracting
+credentials and building new API clients every time. Entries are replaced
+once the token expires or is refreshed.
+"""
+
+import hashlib
+import time
+from datetime import UTC
+from typing import TYPE_CHECKING, Any
+
+from google_slides_mcp.auth.middleware import get_credentials_from_context
+from google_slides_mcp.services.drive_service import DriveService
+from google_slides_mcp.services.slides_service import SlidesService
+
+if TYPE_CHECKING:
+    from fastmcp import Context
+
+# Lifetime for credentials that don't report an expiry (Google access tokens
+# are valid for one hour)
+DEFAULT_TTL_SECONDS = 3000.0
+
+# Token hash -> (Slides service, Drive service, expiry timestamp)
+_SERVICE_CACHE: dict[str, tuple[SlidesService, DriveService, float]] = {}
+
+
+def _cache_key(credentials: Any) -> str:
+    """Derive a cache key from the credentials' access token."""
+    token = getattr(credentials, "token", None)
+    if token:
+        return hashlib.sha256(token.encode()).hexdigest()
+    return f"id:{id(credentials)}"
+
+
+def _expires_at(credentials: Any) -> float:
+    """Get the time at which services built for these credentials go stale."""
+    expiry = getattr(credentials, "expiry", None)
+    if expiry is not None:
+        # google-auth stores expiry as a naive UTC datetime
+        return expiry.replace(tzinfo=UTC).timestamp()
+    return time.time() + DEFAULT_TTL_SECONDS
+
+
+async def _get_services(ctx: "Context") -> tuple[SlidesService, DriveService]:
+    """Get the cached services for the context's credentials, building them once.
+
+    Args:
+        ctx: The MCP context containing auth information
+
+    Returns:
+        Tuple of (SlidesService, DriveService)
+
+    Raises:
+        ValueError: If credentials are not available
+    """
+    credentials = await get_credentials_from_context(ctx)
+    key = _cache_key(credentials)
+    now = time.time()
+
+    cached = _SERVICE_CACHE.get(key)
+    if cached and cached[2] > now:
+        return cached[0], cached[1]
+
+    # Drop stale entries so tokens that were refreshed don't accumulate
+    for stale_key in [k for k, entry in _SERVICE_CACHE.items() if entry[2] <= now]:
+        del _SERVICE_CACHE[stale_key]
+
+    slides_service = SlidesService(credentials)
+    drive_service = DriveService(credentials)
+    _SERVICE_CACHE[key] = (slides_service, drive_service, _expires_at(credentials))
+    return slides_service, drive_service
+
+
+async def get_slides_service(ctx: "Context") -> SlidesService:
+    """Get the Slides service for the context's credentials.
+
+    Args:
+        ctx: The MCP context containing auth information
+
+    Returns:
+        SlidesService shared by tool calls using the same access token
+
+    Raises:
+        ValueError: If credentials are not available
+    """
+    slides_service, _ = await _get_services(ctx)
+    return slides_service
+
+
+async def get_drive_service(ctx: "Context") -> DriveService:
+    """Get the Drive service for the context's credentials.
+
+    Args:
+        ctx: The MCP context containing auth information
+
+    Returns:
+        DriveService shared by tool calls using the same access token
+
+    Raises:
+        ValueError: If credentials are not available
+    """
+    _, drive_service = await _get_services(ctx)
+    return drive_service
@@ -4,10 +4,33 @@ Provides a clean interface to the Google Slides API with credential injection
 from the MCP context.
 """
 
+import asyncio
+import threading
+from collections.abc import Callable
 from typing import Any
 
+import google_auth_httplib2
+import httplib2
 from googleapiclient.discovery import Resource, build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+
+from google_slides_mcp.services.http_client import get_http_client
+from google_slides_mcp.services.json_model import OrjsonModel
+from google_slides_mcp.services.retry import RATE_LIMIT_STATUSES, with_retries
+from google_slides_mcp.utils.presentation_cache import invalidate_presentation
+
+SLIDES_API_URL = "https://slides.googleapis.com/v1"
+
+# Maximum number of requests sent in a single batchUpdate call
+MAX_BATCH_REQUESTS = 100
+
+# Maximum number of batchUpdate chunks in flight for one chunked update
+MAX_CONCURRENT_BATCHES = 3
+
+# Bounds Slides API calls in flight across all tool calls, so parallel
+# tools don't run into Google's concurrent request limits
+_API_SEM = asyncio.Semaphore(5)
 
 
 class SlidesService:
@@ -19,13 +42,53 @@ class SlidesService:
         Args:
             credentials: Google OAuth credentials object
         """
-        self._service: Resource = build("slides", "v1", credentials=credentials)
+        self._credentials = credentials
+        # Per worker thread authorized Http, so connections are reused
+        self._thread_local = threading.local()
+        self._service: Resource = build(
+            "slides",
+            "v1",
+            credentials=credentials,
+            model=OrjsonModel(),
+        )
 
     @property
     def presentations(self) -> Resource:
         """Access the presentations resource."""
         return self._service.presentations()
 
+    async def _execute(self, request: HttpRequest) -> Any:
+        """Execute an API request in a worker thread.
+
+        The request runs with the worker thread's own authorized Http object
+        rather than the resource's, since httplib2 connections are not
+        thread-safe. At most five calls run at once across the process.
+
+        Args:
+            request: The prepared API request
+
+        Returns:
+            The deserialized API response
+        """
+        async with _API_SEM:
+            return await asyncio.to_thread(self._run_with_http, request.execute)
+
+    def _thread_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Get the calling worker thread's authorized Http object, creating it once.
+
+        httplib2 connections are not thread-safe, so each worker thread keeps
+        its own, and reuses it (and its open connection) across calls.
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
+    def _run_with_http(self, execute: Callable[..., Any]) -> Any:
+        """Call a request's execute method with the current thread's Http."""
+        return execute(http=self._thread_http())
+
     async def get_presentation(
         self,
         presentation_id: str,
@@ -49,7 +112,7 @@ class SlidesService:
                 presentationId=presentation_id,
                 fields=fields,
             )
-        return request.execute()
+        return await self._execute(request)
 
     async def get_page(
         self,
@@ -68,12 +131,59 @@ class SlidesService:
         Raises:
             HttpError: If the API request fails
         """
-        return (
+        return await self._execute(
             self.presentations.pages().get(
                 presentationId=presentation_id,
                 pageObjectId=page_id,
             )
-        ).execute()
+        )
+
+    async def get_thumbnail(
+        self,
+        presentation_id: str,
+        page_id: str,
+        mime_type: str = "PNG",
+    ) -> dict:
+        """Generate a thumbnail of a page.
+
+        Calls the REST endpoint directly through the shared async HTTP
+        client rather than the discovery-based resource, so no worker thread
+        or per-call Http object is needed.
+
+        Args:
+            presentation_id: The ID of the presentation
+            page_id: The ID of the page to render
+            mime_type: Thumbnail image format, "PNG" or "JPEG"
+
+        Returns:
+            Thumbnail resource with contentUrl, width and height
+
+        Raises:
+            HttpError: If the API request fails
+        """
+        if not self._credentials.valid:
+            await asyncio.to_thread(
+                self._credentials.refresh,
+                google_auth_httplib2.Request(httplib2.Http()),
+            )
+        headers: dict[str, str] = {}
+        self._credentials.apply(headers)
+
+        url = f"{SLIDES_API_URL}/presentations/{presentation_id}/pages/{page_id}/thumbnail"
+        async with _API_SEM:
+            response = await get_http_client().get(
+                url,
+                params={"thumbnailProperties.mimeType": mime_type},
+                headers=headers,
+            )
+
+        if response.is_error:
+            raise HttpError(
+                httplib2.Response({"status": response.status_code, **response.headers}),
+                response.content,
+                uri=str(response.url),
+            )
+        return response.json()
 
     async def batch_update(
         self,
@@ -82,6 +192,9 @@ class SlidesService:
     ) -> dict:
         """Execute a batch update on a presentation.
 
+        Rate-limited calls are retried with backoff. Any cached copy of the
+        presentation is invalidated afterwards.
+
         Args:
             presentation_id: The ID of the presentation to update
             requests: List of update request objects
@@ -93,12 +206,66 @@ class SlidesService:
             HttpError: If the API request fails
         """
         body = {"requests": requests}
-        return (
-            self.presentations.batchUpdate(
-                presentationId=presentation_id,
-                body=body,
+        request = self.presentations.batchUpdate(presentationId=presentation_id, body=body)
+        try:
+            # A 500 may come after the batch was committed, and replaying it
+            # would fail on duplicate object IDs or double-apply edits, so
+            # only retry rejections
+            return await with_retries(
+                lambda: self._execute(request),
+                statuses=RATE_LIMIT_STATUSES,
+            )
+        finally:
+            invalidate_presentation(presentation_id)
+
+    async def batch_update_chunked(
+        self,
+        presentation_id: str,
+        requests: list[dict],
+        group_size: int = 1,
+    ) -> dict:
+        """Execute a large batch update as several concurrent batchUpdate calls.
+
+        Requests are split into chunks of at most MAX_BATCH_REQUESTS, keeping
+        each call under the API's per-batch soft limit, and up to
+        MAX_CONCURRENT_BATCHES chunks are sent at a time. Chunks may be
+        applied in any order, so requests in different chunks must not
+        depend on each other.
+
+        Args:
+            presentation_id: The ID of the presentation to update
+            requests: List of update request objects
+            group_size: Number of consecutive requests that depend on each
+                other and must be sent in the same call, e.g. the requests
+                creating and then styling one element
+
+        Returns:
+            BatchUpdate response whose replies are in the same order as the
+            requests
+
+        Raises:
+            HttpError: If any of the API requests fails
+        """
+        if len(requests) <= MAX_BATCH_REQUESTS:
+            return await self.batch_update(presentation_id, requests)
+
+        chunk_size = max(MAX_BATCH_REQUESTS // group_size, 1) * group_size
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+
+        async def send(chunk: list[dict]) -> dict:
+            async with semaphore:
+                return await self.batch_update(presentation_id, chunk)
+
+        responses = await asyncio.gather(
+            *(
+                send(requests[start : start + chunk_size])
+                for start in range(0, len(requests), chunk_size)
             )
-        ).execute()
+        )
+        return {
+            "presentationId": presentation_id,
+            "replies": [reply for response in responses for reply in response.get("replies", [])],
+        }
 
     async def create_presentation(
         self,
@@ -116,7 +283,7 @@ class SlidesService:
             HttpError: If the API request fails
         """
         body = {"title": title}
-        return self.presentations.create(body=body).execute()
+        return await self._execute(self.presentations.create(body=body))
 
 
 def build_slides_service(credentials: Any) -> SlidesService:
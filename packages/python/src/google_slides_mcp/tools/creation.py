@@ -4,11 +4,28 @@ Tools for creating slides, text boxes, images, and shapes with
 intuitive parameters using inches instead of EMUs.
 """
 
+import itertools
+import secrets
 from typing import TYPE_CHECKING, Literal
-import uuid
 
 from fastmcp import Context
 
+from google_slides_mcp.services.session import get_slides_service
+from google_slides_mcp.utils.colors import (
+    hex_to_rgb,
+    preparsed_color,
+    rgba_to_solid_fill,
+    rgba_to_solid_fill_from_rgb,
+)
+from google_slides_mcp.utils.presentation_cache import get_layouts_by_name
+from google_slides_mcp.utils.slides_requests import (
+    CreateImageRequest,
+    CreateShapeRequest,
+    element_properties,
+)
+from google_slides_mcp.utils.transforms import SLIDE_SIZES, calculate_alignment_position
+from google_slides_mcp.utils.units import inches_to_emu
+
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
@@ -27,6 +44,105 @@ LAYOUT_TYPES = Literal[
     "CAPTION_ONLY",
 ]
 
+# Object ID suffixes; randomly seeded once so IDs from different server
+# processes don't collide
+_ID_COUNTER = itertools.count(secrets.randbits(32))
+
+# Invariant parts of text box requests, shared by every request built.
+# They are only ever serialized, never modified.
+_TEXT_BOX_STYLE_FIELDS = "fontFamily,fontSize,bold,italic,foregroundColor"
+_ALL_TEXT = {"type": "ALL"}
+
+
+# Default shape outline color, parsed once at import. The parsed dict is
+# shared, so it only reaches requests through rgba_to_solid_fill_from_rgb,
+# which copies it.
+DEFAULT_OUTLINE_COLOR = "#000000"
+_PREPARSED_COLORS = {DEFAULT_OUTLINE_COLOR: preparsed_color(DEFAULT_OUTLINE_COLOR)}
+
+
+def _solid_fill(hex_color: str) -> dict:
+    """Build a solidFill, skipping the parse for preparsed default colors."""
+    rgb = _PREPARSED_COLORS.get(hex_color)
+    if rgb is None:
+        return rgba_to_solid_fill(hex_color)
+    return rgba_to_solid_fill_from_rgb(rgb)
+
+
+def _gen_id(prefix: str) -> str:
+    """Generate a unique object ID with the given prefix."""
+    return f"{prefix}_{next(_ID_COUNTER):08x}"
+
+
+def _text_box_requests(
+    element_id: str,
+    slide_id: str,
+    text: str,
+    x: float,
+    y: float,
+    width: float,
+    height: float,
+    font_size: int,
+    font_family: str,
+    bold: bool,
+    italic: bool,
+    rgb: dict[str, float],
+    alignment: str,
+) -> list[dict]:
+    """Build the requests that create, fill, and style one text box.
+
+    Positions and sizes are in inches, font size in points, and the text
+    color is already parsed so callers can validate colors up front.
+    """
+    return [
+        # Create the text box shape
+        {
+            "createShape": CreateShapeRequest(
+                object_id=element_id,
+                shape_type="TEXT_BOX",
+                element_properties=element_properties(
+                    slide_id,
+                    inches_to_emu(x),
+                    inches_to_emu(y),
+                    inches_to_emu(width),
+                    inches_to_emu(height),
+                ),
+            )
+        },
+        # Insert the text
+        {
+            "insertText": {
+                "objectId": element_id,
+                "text": text,
+                "insertionIndex": 0,
+            }
+        },
+        # Style the text
+        {
+            "updateTextStyle": {
+                "objectId": element_id,
+                "style": {
+                    "fontFamily": font_family,
+                    "fontSize": {"magnitude": font_size, "unit": "PT"},
+                    "bold": bold,
+                    "italic": italic,
+                    "foregroundColor": {"opaqueColor": {"rgbColor": rgb}},
+                },
+                "fields": _TEXT_BOX_STYLE_FIELDS,
+                "textRange": _ALL_TEXT,
+            }
+        },
+        # Set paragraph alignment
+        {
+            "updateParagraphStyle": {
+                "objectId": element_id,
+                "style": {"alignment": alignment},
+                "fields": "alignment",
+                "textRange": _ALL_TEXT,
+            }
+        },
+    ]
+
 
 def register_creation_tools(mcp: "FastMCP") -> None:
     """Register creation tools with the MCP application.
@@ -54,26 +170,14 @@ def register_creation_tools(mcp: "FastMCP") -> None:
             - slide_id: ID of the new slide
             - placeholder_ids: Mapping of placeholder types to their IDs
         """
-        from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
-        from google_slides_mcp.services.slides_service import SlidesService
-
-        middleware = GoogleAuthMiddleware()
-        credentials = await middleware.extract_credentials(ctx)
-        service = SlidesService(credentials)
-
-        # Get presentation to find the layout
-        presentation = await service.get_presentation(presentation_id)
+        service = await get_slides_service(ctx)
 
-        # Find matching layout
-        layout_id = None
-        for layout_obj in presentation.get("layouts", []):
-            layout_props = layout_obj.get("layoutProperties", {})
-            if layout_props.get("name", "").upper() == layout:
-                layout_id = layout_obj.get("objectId")
-                break
+        # Find the matching layout in the presentation
+        layouts = await get_layouts_by_name(service, presentation_id)
+        layout_obj = layouts.get(layout)
 
         # Generate a unique ID for the new slide
-        slide_id = f"slide_{uuid.uuid4().hex[:8]}"
+        slide_id = _gen_id("slide")
 
         request: dict = {
             "createSlide": {
@@ -82,22 +186,47 @@ def register_creation_tools(mcp: "FastMCP") -> None:
             }
         }
 
-        if layout_id:
-            request["createSlide"]["slideLayoutReference"] = {"layoutId": layout_id}
+        # Pre-assign IDs to the layout's placeholders so they don't have to
+        # be looked up with a second request after the slide is created
+        placeholder_ids = {}
+        if layout_obj:
+            request["createSlide"]["slideLayoutReference"] = {
+                "layoutId": layout_obj.get("objectId")
+            }
+
+            mappings = []
+            for element in layout_obj.get("pageElements", []):
+                placeholder = element.get("shape", {}).get("placeholder")
+                if not placeholder or "type" not in placeholder:
+                    continue
+                object_id = _gen_id("ph")
+                mappings.append(
+                    {
+                        "layoutPlaceholder": {
+                            "type": placeholder["type"],
+                            "index": placeholder.get("index", 0),
+                        },
+                        "objectId": object_id,
+                    }
+                )
+                placeholder_ids[placeholder["type"]] = object_id
+
+            if mappings:
+                request["createSlide"]["placeholderIdMappings"] = mappings
 
         if insertion_index is not None:
             request["createSlide"]["insertionIndex"] = insertion_index
 
         await service.batch_update(presentation_id, [request])
 
-        # Get the created slide to find placeholder IDs
-        slide_info = await service.get_page(presentation_id, slide_id)
-        placeholder_ids = {}
-        for element in slide_info.get("pageElements", []):
-            placeholder = element.get("shape", {}).get("placeholder", {})
-            if placeholder:
-                placeholder_type = placeholder.get("type", "UNKNOWN")
-                placeholder_ids[placeholder_type] = element.get("objectId")
+        if not placeholder_ids:
+            # Layout placeholders unknown, get the created slide to find them
+            slide_info = await service.get_page(presentation_id, slide_id)
+            for element in slide_info.get("pageElements", []):
+                placeholder = element.get("shape", {}).get("placeholder", {})
+                if placeholder:
+                    placeholder_type = placeholder.get("type", "UNKNOWN")
+                    placeholder_ids[placeholder_type] = element.get("objectId")
 
         return {
             "slide_id": slide_id,
@@ -141,82 +270,92 @@ def register_creation_tools(mcp: "FastMCP") -> None:
         Returns:
             Dictionary with the created element ID
         """
-        from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
-        from google_slides_mcp.services.slides_service import SlidesService
-        from google_slides_mcp.utils.colors import hex_to_rgb
-        from google_slides_mcp.utils.units import inches_to_emu, points_to_emu
-
-        middleware = GoogleAuthMiddleware()
-        credentials = await middleware.extract_credentials(ctx)
-        service = SlidesService(credentials)
+        service = await get_slides_service(ctx)
 
         # Generate unique ID
-        element_id = f"textbox_{uuid.uuid4().hex[:8]}"
-
-        requests = [
-            # Create the text box shape
-            {
-                "createShape": {
-                    "objectId": element_id,
-                    "shapeType": "TEXT_BOX",
-                    "elementProperties": {
-                        "pageObjectId": slide_id,
-                        "size": {
-                            "width": {"magnitude": inches_to_emu(width), "unit": "EMU"},
-                            "height": {"magnitude": inches_to_emu(height), "unit": "EMU"},
-                        },
-                        "transform": {
-                            "scaleX": 1,
-                            "scaleY": 1,
-                            "shearX": 0,
-                            "shearY": 0,
-                            "translateX": inches_to_emu(x),
-                            "translateY": inches_to_emu(y),
-                            "unit": "EMU",
-                        },
-                    },
-                }
-            },
-            # Insert the text
-            {
-                "insertText": {
-                    "objectId": element_id,
-                    "text": text,
-                    "insertionIndex": 0,
-                }
-            },
-            # Style the text
-            {
-                "updateTextStyle": {
-                    "objectId": element_id,
-                    "style": {
-                        "fontFamily": font_family,
-                        "fontSize": {"magnitude": font_size, "unit": "PT"},
-                        "bold": bold,
-                        "italic": italic,
-                        "foregroundColor": {
-                            "opaqueColor": {"rgbColor": hex_to_rgb(color)}
-                        },
-                    },
-                    "fields": "fontFamily,fontSize,bold,italic,foregroundColor",
-                    "textRange": {"type": "ALL"},
-                }
-            },
-            # Set paragraph alignment
-            {
-                "updateParagraphStyle": {
-                    "objectId": element_id,
-                    "style": {"alignment": alignment},
-                    "fields": "alignment",
-                    "textRange": {"type": "ALL"},
-                }
-            },
-        ]
+        element_id = _gen_id("textbox")
+
+        requests = _text_box_requests(
+            element_id,
+            slide_id,
+            text,
+            x,
+            y,
+            width,
+            height,
+            font_size,
+            font_family,
+            bold,
+            italic,
+            hex_to_rgb(color),
+            alignment,
+        )
 
         await service.batch_update(presentation_id, requests)
 
         return {"element_id": element_id}
 
+    @mcp.tool()
+    async def add_text_boxes(
+        ctx: Context,
+        presentation_id: str,
+        items: list[dict],
+    ) -> dict:
+        """Add several styled text boxes in as few API calls as possible.
+
+        Each item accepts the same fields as add_text_box. slide_id and text
+        are required, the rest default to add_text_box's defaults. Text boxes
+        may be on different slides.
+
+        Args:
+            presentation_id: The presentation ID
+            items: Text box specifications, e.g.
+                [{"slide_id": "p1", "text": "Hello", "x": 1.0, "y": 2.0}]
+
+        Returns:
+            Dictionary with the created element IDs, in the same order as items
+
+        Raises:
+            ValueError: If an item is missing slide_id or text
+        """
+        service = await get_slides_service(ctx)
+
+        element_ids = []
+        requests = []
+        for i, item in enumerate(items):
+            if "slide_id" not in item or "text" not in item:
+                raise ValueError(f"Item {i} must include slide_id and text")
+
+            element_id = _gen_id("textbox")
+            element_ids.append(element_id)
+            requests.extend(
+                _text_box_requests(
+                    element_id,
+                    item["slide_id"],
+                    item["text"],
+                    item.get("x", 1.0),
+                    item.get("y", 1.0),
+                    item.get("width", 4.0),
+                    item.get("height", 1.0),
+                    item.get("font_size", 18),
+                    item.get("font_family", "Arial"),
+                    item.get("bold", False),
+                    item.get("italic", False),
+                    hex_to_rgb(item.get("color", "#000000")),
+                    item.get("alignment", "LEFT"),
+                )
+            )
+
+        if requests:
+            # Keep each text box's requests together in one batch
+            await service.batch_update_chunked(
+                presentation_id,
+                requests,
+                group_size=len(requests) // len(items),
+            )
+
+        return {"element_ids": element_ids}
+
     @mcp.tool()
     async def add_image(
         ctx: Context,
@@ -249,20 +388,10 @@ def register_creation_tools(mcp: "FastMCP") -> None:
         Returns:
             Dictionary with the created element ID
         """
-        from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
-        from google_slides_mcp.services.slides_service import SlidesService
-        from google_slides_mcp.utils.transforms import (
-            SLIDE_SIZES,
-            calculate_alignment_position,
-        )
-        from google_slides_mcp.utils.units import inches_to_emu
-
-        middleware = GoogleAuthMiddleware()
-        credentials = await middleware.extract_credentials(ctx)
-        service = SlidesService(credentials)
+        service = await get_slides_service(ctx)
 
         # Generate unique ID
-        element_id = f"image_{uuid.uuid4().hex[:8]}"
+        element_id = _gen_id("image")
 
         # Default size if not specified
         default_width = 4.0
@@ -287,26 +416,17 @@ def register_creation_tools(mcp: "FastMCP") -> None:
             pos_y = inches_to_emu(y if y is not None else 1.0)
 
         request = {
-            "createImage": {
-                "objectId": element_id,
-                "url": image_url,
-                "elementProperties": {
-                    "pageObjectId": slide_id,
-                    "size": {
-                        "width": {"magnitude": inches_to_emu(img_width), "unit": "EMU"},
-                        "height": {"magnitude": inches_to_emu(img_height), "unit": "EMU"},
-                    },
-                    "transform": {
-                        "scaleX": 1,
-                        "scaleY": 1,
-                        "shearX": 0,
-                        "shearY": 0,
-                        "translateX": pos_x,
-                        "translateY": pos_y,
-                        "unit": "EMU",
-                    },
-                },
-            }
+            "createImage": CreateImageRequest(
+                object_id=element_id,
+                url=image_url,
+                element_properties=element_properties(
+                    slide_id,
+                    pos_x,
+                    pos_y,
+                    inches_to_emu(img_width),
+                    inches_to_emu(img_height),
+                ),
+            )
         }
 
         await service.batch_update(presentation_id, [request])
@@ -324,7 +444,7 @@ def register_creation_tools(mcp: "FastMCP") -> None:
         width: float,
         height: float,
         fill_color: str | None = None,
-        outline_color: str | None = "#000000",
+        outline_color: str | None = DEFAULT_OUTLINE_COLOR,
         outline_weight: float = 1.0,
     ) -> dict:
         """Add a shape to a slide.
@@ -345,40 +465,24 @@ def register_creation_tools(mcp: "FastMCP") -> None:
         Returns:
             Dictionary with the created element ID
         """
-        from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
-        from google_slides_mcp.services.slides_service import SlidesService
-        from google_slides_mcp.utils.colors import hex_to_rgb
-        from google_slides_mcp.utils.units import inches_to_emu, points_to_emu
-
-        middleware = GoogleAuthMiddleware()
-        credentials = await middleware.extract_credentials(ctx)
-        service = SlidesService(credentials)
+        service = await get_slides_service(ctx)
 
         # Generate unique ID
-        element_id = f"shape_{uuid.uuid4().hex[:8]}"
+        element_id = _gen_id("shape")
 
         requests = [
             {
-                "createShape": {
-                    "objectId": element_id,
-                    "shapeType": shape_type,
-                    "elementProperties": {
-                        "pageObjectId": slide_id,
-                        "size": {
-                            "width": {"magnitude": inches_to_emu(width), "unit": "EMU"},
-                            "height": {"magnitude": inches_to_emu(height), "unit": "EMU"},
-                        },
-                        "transform": {
-                            "scaleX": 1,
-                            "scaleY": 1,
-                            "shearX": 0,
-                            "shearY": 0,
-                            "translateX": inches_to_emu(x),
-                            "translateY": inches_to_emu(y),
-                            "unit": "EMU",
-                        },
-                    },
-                }
+                "createShape": CreateShapeRequest(
+                    object_id=element_id,
+                    shape_type=shape_type,
+                    element_properties=element_properties(
+                        slide_id,
+                        inches_to_emu(x),
+                        inches_to_emu(y),
+                        inches_to_emu(width),
+                        inches_to_emu(height),
+                    ),
+                )
             }
         ]
 
@@ -387,16 +491,12 @@ def register_creation_tools(mcp: "FastMCP") -> None:
         fields = []
 
         if fill_color is not None:
-            shape_props["shapeBackgroundFill"] = {
-                "solidFill": {"color": {"rgbColor": hex_to_rgb(fill_color)}}
-            }
+            shape_props["shapeBackgroundFill"] = _solid_fill(fill_color)
             fields.append("shapeBackgroundFill")
 
         if outline_color is not None:
             shape_props["outline"] = {
-                "outlineFill": {
-                    "solidFill": {"color": {"rgbColor": hex_to_rgb(outline_color)}}
-                },
+                "outlineFill": _solid_fill(outline_color),
                 "weight": {"magnitude": outline_weight, "unit": "PT"},
             }
             fields.append("outline")
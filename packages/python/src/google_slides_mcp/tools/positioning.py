@@ -52,9 +52,9 @@ def register_positioning_tools(mcp: "FastMCP") -> None:
         """
         from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
         from google_slides_mcp.services.slides_service import SlidesService
+        from google_slides_mcp.utils.slides_requests import AffineTransform
         from google_slides_mcp.utils.transforms import (
             SLIDE_SIZES,
-            build_absolute_transform,
             calculate_alignment_position,
             extract_element_bounds,
         )
@@ -119,7 +119,7 @@ def register_positioning_tools(mcp: "FastMCP") -> None:
             new_y = inches_to_emu(y) if y is not None else current_y
 
         # Build transform
-        transform = build_absolute_transform(new_x, new_y)
+        transform = AffineTransform(translate_x=new_x, translate_y=new_y)
 
         # Create update request
         requests = [
@@ -189,9 +189,9 @@ def register_positioning_tools(mcp: "FastMCP") -> None:
         """
         from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
         from google_slides_mcp.services.slides_service import SlidesService
+        from google_slides_mcp.utils.slides_requests import AffineTransform
         from google_slides_mcp.utils.transforms import (
             SLIDE_SIZES,
-            build_absolute_transform,
             extract_element_bounds,
         )
         from google_slides_mcp.utils.units import emu_to_inches, inches_to_emu
@@ -250,7 +250,7 @@ def register_positioning_tools(mcp: "FastMCP") -> None:
 
             current_x = int(gap)
             for elem in elements:
-                transform = build_absolute_transform(current_x, elem["y"])
+                transform = AffineTransform(translate_x=current_x, translate_y=elem["y"])
                 requests.append(
                     {
                         "updatePageElementTransform": {
@@ -278,7 +278,7 @@ def register_positioning_tools(mcp: "FastMCP") -> None:
 
             current_y = int(gap)
             for elem in elements:
-                transform = build_absolute_transform(elem["x"], current_y)
+                transform = AffineTransform(translate_x=elem["x"], translate_y=current_y)
                 requests.append(
                     {
                         "updatePageElementTransform": {
@@ -329,9 +329,9 @@ def register_positioning_tools(mcp: "FastMCP") -> None:
         """
         from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
         from google_slides_mcp.services.slides_service import SlidesService
+        from google_slides_mcp.utils.slides_requests import AffineTransform
         from google_slides_mcp.utils.transforms import (
             SLIDE_SIZES,
-            build_absolute_transform,
             extract_element_bounds,
         )
         from google_slides_mcp.utils.units import emu_to_inches
@@ -412,7 +412,7 @@ def register_positioning_tools(mcp: "FastMCP") -> None:
                 ref_bottom = ref_elem["y"] + ref_elem["height"]
                 new_y = ref_bottom - elem["height"]
 
-            transform = build_absolute_transform(new_x, new_y)
+            transform = AffineTransform(translate_x=new_x, translate_y=new_y)
             requests.append(
                 {
                     "updatePageElementTransform": {
@@ -1,16 +1,23 @@
 """Template operation tools for Google Slides.
 
-Tools for working with presentation templates: copying, finding and
-replacing placeholder text and images.
+Tools for working with presentation templates: copying (singly or in a
+batch), finding and replacing placeholder text and images.
 """
 
 from typing import TYPE_CHECKING, Literal
 
 from fastmcp import Context
+from googleapiclient.errors import HttpError
+
+from google_slides_mcp.services.session import get_drive_service, get_slides_service
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
+# Presentation MIME types
+MIME_GOOGLE_SLIDES = "application/vnd.google-apps.presentation"
+MIME_PPTX = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
 
 def register_template_tools(mcp: "FastMCP") -> None:
     """Register template tools with the MCP application.
@@ -48,14 +55,7 @@ def register_template_tools(mcp: "FastMCP") -> None:
             - url: Direct URL to open the presentation
             - converted: Whether format conversion was performed
         """
-        from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
-        from google_slides_mcp.services.drive_service import DriveService
-
-        MIME_GOOGLE_SLIDES = "application/vnd.google-apps.presentation"
-
-        middleware = GoogleAuthMiddleware()
-        credentials = await middleware.extract_credentials(ctx)
-        service = DriveService(credentials)
+        service = await get_drive_service(ctx)
 
         result = await service.copy_file(
             file_id=template_id,
@@ -70,6 +70,67 @@ def register_template_tools(mcp: "FastMCP") -> None:
             "converted": convert_to_slides,
         }
 
+    @mcp.tool()
+    async def copy_templates(
+        ctx: Context,
+        copies: list[dict],
+    ) -> dict:
+        """Copy several templates at once, e.g. one deck per client.
+
+        All copies are made in a single Drive batch call. Each copy has
+        template_id and new_name, plus optional destination_folder_id and
+        convert_to_slides as in copy_template. A failed copy does not stop
+        the others; it is reported with its error instead.
+
+        Args:
+            copies: Copy specifications, e.g.
+                [{"template_id": "abc123", "new_name": "Acme Q3 Review"}]
+
+        Returns:
+            Dictionary with:
+            - copies: Per-copy results in input order, each either
+              presentation_id, url and converted as in copy_template, or
+              template_id and error
+            - created: Number of presentations created
+            - failed: Number of copies that failed
+
+        Raises:
+            ValueError: If a copy is missing template_id or new_name
+        """
+        specs = []
+        for i, copy in enumerate(copies):
+            if "template_id" not in copy or "new_name" not in copy:
+                raise ValueError(f"Copy {i} must include template_id and new_name")
+            specs.append(
+                {
+                    "file_id": copy["template_id"],
+                    "new_name": copy["new_name"],
+                    "parent_folder_id": copy.get("destination_folder_id"),
+                    "target_mime_type": (
+                        MIME_GOOGLE_SLIDES if copy.get("convert_to_slides") else None
+                    ),
+                }
+            )
+
+        service = await get_drive_service(ctx)
+        results = await service.batch_copy_files(specs)
+
+        report = []
+        for copy, result in zip(copies, results):
+            if isinstance(result, HttpError):
+                report.append({"template_id": copy["template_id"], "error": str(result.reason)})
+            else:
+                report.append(
+                    {
+                        "presentation_id": result["id"],
+                        "url": f"https://docs.google.com/presentation/d/{result['id']}",
+                        "converted": bool(copy.get("convert_to_slides")),
+                    }
+                )
+
+        failed = sum(1 for entry in report if "error" in entry)
+        return {"copies": report, "created": len(report) - failed, "failed": failed}
+
     @mcp.tool()
     async def replace_placeholders(
         ctx: Context,
@@ -89,12 +150,7 @@ def register_template_tools(mcp: "FastMCP") -> None:
         Returns:
             Dictionary with count of replacements made for each placeholder
         """
-        from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
-        from google_slides_mcp.services.slides_service import SlidesService
-
-        middleware = GoogleAuthMiddleware()
-        credentials = await middleware.extract_credentials(ctx)
-        service = SlidesService(credentials)
+        service = await get_slides_service(ctx)
 
         # Build replaceAllText requests
         requests = [
@@ -107,14 +163,13 @@ def register_template_tools(mcp: "FastMCP") -> None:
             for placeholder, replacement in replacements.items()
         ]
 
-        response = await service.batch_update(presentation_id, requests)
+        response = await service.batch_update_chunked(presentation_id, requests)
 
         # Extract replacement counts from response
-        counts = {}
-        for i, (placeholder, _) in enumerate(replacements.items()):
-            reply = response.get("replies", [])[i]
-            occurrences = reply.get("replaceAllText", {}).get("occurrencesChanged", 0)
-            counts[placeholder] = occurrences
+        counts = {
+            placeholder: reply.get("replaceAllText", {}).get("occurrencesChanged", 0)
+            for placeholder, reply in zip(replacements, response.get("replies", ()))
+        }
 
         return {"replacements": counts, "total": sum(counts.values())}
 
@@ -141,12 +196,7 @@ def register_template_tools(mcp: "FastMCP") -> None:
         Returns:
             Dictionary with count of shapes replaced
         """
-        from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
-        from google_slides_mcp.services.slides_service import SlidesService
-
-        middleware = GoogleAuthMiddleware()
-        credentials = await middleware.extract_credentials(ctx)
-        service = SlidesService(credentials)
+        service = await get_slides_service(ctx)
 
         requests = [
             {
@@ -167,6 +217,60 @@ def register_template_tools(mcp: "FastMCP") -> None:
 
         return {"shapes_replaced": occurrences}
 
+    @mcp.tool()
+    async def replace_placeholders_with_images(
+        ctx: Context,
+        presentation_id: str,
+        replacements: list[dict],
+    ) -> dict:
+        """Replace several image placeholders in a single update.
+
+        Each replacement has placeholder_text and image_url, plus an optional
+        replace_method (CENTER_INSIDE or CENTER_CROP, default CENTER_INSIDE)
+        as in replace_placeholder_with_image.
+
+        Args:
+            presentation_id: The presentation to modify
+            replacements: Placeholder replacements, e.g.
+                [{"placeholder_text": "{{logo}}", "image_url": "https://..."}]
+
+        Returns:
+            Dictionary with count of shapes replaced for each placeholder
+
+        Raises:
+            ValueError: If a replacement is missing placeholder_text or image_url
+        """
+        service = await get_slides_service(ctx)
+
+        requests = []
+        for i, replacement in enumerate(replacements):
+            if "placeholder_text" not in replacement or "image_url" not in replacement:
+                raise ValueError(f"Replacement {i} must include placeholder_text and image_url")
+            requests.append(
+                {
+                    "replaceAllShapesWithImage": {
+                        "imageUrl": replacement["image_url"],
+                        "replaceMethod": replacement.get("replace_method", "CENTER_INSIDE"),
+                        "containsText": {
+                            "text": replacement["placeholder_text"],
+                            "matchCase": True,
+                        },
+                    }
+                }
+            )
+
+        response = await service.batch_update_chunked(presentation_id, requests)
+
+        # The same placeholder may appear in several replacements, e.g. with
+        # different replace methods, so its counts are added up
+        counts: dict[str, int] = {}
+        for replacement, reply in zip(replacements, response.get("replies", ())):
+            placeholder = replacement["placeholder_text"]
+            occurrences = reply.get("replaceAllShapesWithImage", {}).get("occurrencesChanged", 0)
+            counts[placeholder] = counts.get(placeholder, 0) + occurrences
+
+        return {"replacements": counts, "total": sum(counts.values())}
+
     @mcp.tool()
     async def search_presentations(
         ctx: Context,
@@ -203,16 +307,7 @@ def register_template_tools(mcp: "FastMCP") -> None:
             - next_page_token: Token for next page (if more results)
             - total_returned: Number of results in this response
         """
-        from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
-        from google_slides_mcp.services.drive_service import DriveService
-
-        # Presentation MIME types
-        MIME_GOOGLE_SLIDES = "application/vnd.google-apps.presentation"
-        MIME_PPTX = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
-
-        middleware = GoogleAuthMiddleware()
-        credentials = await middleware.extract_credentials(ctx)
-        service = DriveService(credentials)
+        service = await get_drive_service(ctx)
 
         result = await service.list_files(
             query=query,
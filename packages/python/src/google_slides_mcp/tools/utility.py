@@ -4,13 +4,121 @@ Tools for listing slides, getting element information, and
 exporting thumbnails.
 """
 
-from typing import TYPE_CHECKING, Literal
+import asyncio
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Literal
 
 from fastmcp import Context
 
+from google_slides_mcp.services.retry import with_retries
+from google_slides_mcp.services.session import get_slides_service
+from google_slides_mcp.utils.presentation_cache import (
+    get_element_index,
+    get_presentation_cached,
+)
+from google_slides_mcp.utils.transforms import extract_element_bounds
+from google_slides_mcp.utils.units import emu_to_inches
+
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
+# Bounds concurrent thumbnail requests, which are expensive for Google to
+# render and count against per-user concurrency limits
+_THUMBNAIL_SEM = asyncio.Semaphore(4)
+
+
+def _path(data: Any, *keys: str, default: Any = ()) -> Any:
+    """Look up a nested value, returning default if any key along the way is missing.
+
+    Avoids allocating an empty dict default at every level of a chained
+    .get(key, {}) lookup.
+    """
+    try:
+        for key in keys:
+            data = data[key]
+    except (KeyError, TypeError):
+        return default
+    return data
+
+
+def _slide_title(slide: dict) -> str:
+    """Get a slide's title: the first non-empty text run of its first title placeholder."""
+    title_shape = next(
+        (
+            element["shape"]
+            for element in slide.get("pageElements", ())
+            if _path(element, "shape", "placeholder", "type", default=None) == "TITLE"
+        ),
+        None,
+    )
+    return next(
+        (
+            content
+            for text_elem in _path(title_shape, "text", "textElements")
+            if (content := _path(text_elem, "textRun", "content", default="").strip())
+        ),
+        "",
+    )
+
+
+def _handle_shape(shape: dict, info: dict) -> None:
+    info["type"] = "SHAPE"
+    info["shape_type"] = shape.get("shapeType", "UNKNOWN")
+
+    # Extract text if present
+    text_content = "".join(
+        _path(text_elem, "textRun", "content", default="")
+        for text_elem in _path(shape, "text", "textElements")
+    ).strip()
+    if text_content:
+        info["text"] = text_content
+
+    # Check for placeholder
+    placeholder = shape.get("placeholder")
+    if placeholder:
+        info["placeholder_type"] = placeholder.get("type")
+
+
+def _handle_image(image: dict, info: dict) -> None:
+    info["type"] = "IMAGE"
+    info["image_url"] = image.get("sourceUrl", "")
+    info["content_url"] = image.get("contentUrl", "")
+
+
+def _handle_table(table: dict, info: dict) -> None:
+    info["type"] = "TABLE"
+    info["rows"] = table.get("rows", 0)
+    info["columns"] = table.get("columns", 0)
+
+
+def _handle_line(line: dict, info: dict) -> None:
+    info["type"] = "LINE"
+    info["line_type"] = line.get("lineType", "UNKNOWN")
+
+
+def _handle_video(video: dict, info: dict) -> None:
+    info["type"] = "VIDEO"
+    info["video_source"] = video.get("source", "UNKNOWN")
+    info["video_url"] = video.get("url", "")
+
+
+def _handle_sheets_chart(chart: dict, info: dict) -> None:
+    info["type"] = "SHEETS_CHART"
+    info["spreadsheet_id"] = chart.get("spreadsheetId", "")
+    info["chart_id"] = chart.get("chartId", "")
+
+
+# Page element kind key -> handler adding that kind's details to the info
+# returned by get_element_info. Checked in order; the first key present wins.
+_ELEMENT_HANDLERS: dict[str, Callable[[dict, dict], None]] = {
+    "shape": _handle_shape,
+    "image": _handle_image,
+    "table": _handle_table,
+    "line": _handle_line,
+    "video": _handle_video,
+    "sheetsChart": _handle_sheets_chart,
+}
+
 
 def register_utility_tools(mcp: "FastMCP") -> None:
     """Register utility tools with the MCP application.
@@ -36,34 +144,16 @@ def register_utility_tools(mcp: "FastMCP") -> None:
             - title: Title text (extracted from title placeholder)
             - element_count: Number of elements on the slide
         """
-        from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
-        from google_slides_mcp.services.slides_service import SlidesService
+        service = await get_slides_service(ctx)
 
-        middleware = GoogleAuthMiddleware()
-        credentials = await middleware.extract_credentials(ctx)
-        service = SlidesService(credentials)
-
-        presentation = await service.get_presentation(presentation_id)
+        presentation = await get_presentation_cached(service, presentation_id)
 
         slides_info = []
         for i, slide in enumerate(presentation.get("slides", [])):
             slide_id = slide.get("objectId", "")
             element_count = len(slide.get("pageElements", []))
 
-            # Try to extract title from title placeholder
-            title = ""
-            for element in slide.get("pageElements", []):
-                shape = element.get("shape", {})
-                placeholder = shape.get("placeholder", {})
-                if placeholder.get("type") == "TITLE":
-                    text_elements = shape.get("text", {}).get("textElements", [])
-                    for text_elem in text_elements:
-                        text_run = text_elem.get("textRun", {})
-                        content = text_run.get("content", "")
-                        if content.strip():
-                            title = content.strip()
-                            break
-                    break
+            title = _slide_title(slide)
 
             slides_info.append(
                 {
@@ -101,26 +191,10 @@ def register_utility_tools(mcp: "FastMCP") -> None:
             - shape_type: Shape type (if applicable)
             - image_url: Source URL (if applicable)
         """
-        from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
-        from google_slides_mcp.services.slides_service import SlidesService
-        from google_slides_mcp.utils.transforms import extract_element_bounds
-        from google_slides_mcp.utils.units import emu_to_inches
-
-        middleware = GoogleAuthMiddleware()
-        credentials = await middleware.extract_credentials(ctx)
-        service = SlidesService(credentials)
-
-        presentation = await service.get_presentation(presentation_id)
-
-        # Find the element
-        element = None
-        for slide in presentation.get("slides", []):
-            for page_element in slide.get("pageElements", []):
-                if page_element.get("objectId") == element_id:
-                    element = page_element
-                    break
-            if element:
-                break
+        service = await get_slides_service(ctx)
+
+        element_index = await get_element_index(service, presentation_id)
+        element = element_index.get(element_id)
 
         if not element:
             raise ValueError(f"Element {element_id} not found")
@@ -138,56 +212,10 @@ def register_utility_tools(mcp: "FastMCP") -> None:
         }
 
         # Determine type and type-specific info
-        if "shape" in element:
-            shape = element["shape"]
-            info["type"] = "SHAPE"
-            info["shape_type"] = shape.get("shapeType", "UNKNOWN")
-
-            # Extract text if present
-            text_content = ""
-            text_elements = shape.get("text", {}).get("textElements", [])
-            for text_elem in text_elements:
-                text_run = text_elem.get("textRun", {})
-                content = text_run.get("content", "")
-                text_content += content
-
-            if text_content.strip():
-                info["text"] = text_content.strip()
-
-            # Check for placeholder
-            placeholder = shape.get("placeholder", {})
-            if placeholder:
-                info["placeholder_type"] = placeholder.get("type")
-
-        elif "image" in element:
-            info["type"] = "IMAGE"
-            image = element["image"]
-            info["image_url"] = image.get("sourceUrl", "")
-            info["content_url"] = image.get("contentUrl", "")
-
-        elif "table" in element:
-            info["type"] = "TABLE"
-            table = element["table"]
-            info["rows"] = table.get("rows", 0)
-            info["columns"] = table.get("columns", 0)
-
-        elif "line" in element:
-            info["type"] = "LINE"
-            line = element["line"]
-            info["line_type"] = line.get("lineType", "UNKNOWN")
-
-        elif "video" in element:
-            info["type"] = "VIDEO"
-            video = element["video"]
-            info["video_source"] = video.get("source", "UNKNOWN")
-            info["video_url"] = video.get("url", "")
-
-        elif "sheetsChart" in element:
-            info["type"] = "SHEETS_CHART"
-            chart = element["sheetsChart"]
-            info["spreadsheet_id"] = chart.get("spreadsheetId", "")
-            info["chart_id"] = chart.get("chartId", "")
-
+        for key, handler in _ELEMENT_HANDLERS.items():
+            if key in element:
+                handler(element[key], info)
+                break
         else:
             info["type"] = "UNKNOWN"
 
@@ -213,33 +241,54 @@ def register_utility_tools(mcp: "FastMCP") -> None:
             - width: Image width in pixels
             - height: Image height in pixels
         """
-        from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
-        from google_slides_mcp.services.slides_service import SlidesService
-
-        middleware = GoogleAuthMiddleware()
-        credentials = await middleware.extract_credentials(ctx)
-        service = SlidesService(credentials)
-
-        # Get the thumbnail using the pages.getThumbnail method
-        # Note: This requires building a custom request since it's not
-        # part of the standard presentations resource
-        from googleapiclient.discovery import build
-
-        slides_service = build("slides", "v1", credentials=credentials)
-
-        thumbnail = (
-            slides_service.presentations()
-            .pages()
-            .getThumbnail(
-                presentationId=presentation_id,
-                pageObjectId=slide_id,
-                thumbnailProperties_mimeType=mime_type,
-            )
-            .execute()
-        )
+        service = await get_slides_service(ctx)
+
+        thumbnail = await service.get_thumbnail(presentation_id, slide_id, mime_type)
 
         return {
             "content_url": thumbnail.get("contentUrl", ""),
             "width": thumbnail.get("width", 0),
             "height": thumbnail.get("height", 0),
         }
+
+    @mcp.tool()
+    async def export_thumbnails(
+        ctx: Context,
+        presentation_id: str,
+        slide_ids: list[str],
+        mime_type: Literal["PNG", "JPEG"] = "PNG",
+    ) -> list[dict]:
+        """Generate thumbnail images for several slides concurrently.
+
+        Rate-limited requests are retried with exponential backoff.
+
+        Args:
+            presentation_id: The presentation ID
+            slide_ids: The slides to generate thumbnails for
+            mime_type: Image format (PNG or JPEG)
+
+        Returns:
+            List aligned with slide_ids, each with:
+            - slide_id: The slide's object ID
+            - content_url: Temporary URL to the thumbnail image
+            - width: Image width in pixels
+            - height: Image height in pixels
+        """
+        service = await get_slides_service(ctx)
+
+        async def fetch(slide_id: str) -> dict:
+            # The semaphore is only held for each attempt, not across the
+            # backoff sleep, so a rate-limited slide doesn't block the others
+            async def attempt() -> dict:
+                async with _THUMBNAIL_SEM:
+                    return await service.get_thumbnail(presentation_id, slide_id, mime_type)
+
+            thumbnail = await with_retries(attempt)
+            return {
+                "slide_id": slide_id,
+                "content_url": thumbnail.get("contentUrl", ""),
+                "width": thumbnail.get("width", 0),
+                "height": thumbnail.get("height", 0),
+            }
+
+        return await asyncio.gather(*(fetch(slide_id) for slide_id in slide_ids))
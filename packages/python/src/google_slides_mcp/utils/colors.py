@@ -4,6 +4,46 @@ Google Slides uses RGB values in the 0-1 range.
 This module provides conversion between hex colors and Google's RGB format.
 """
 
+import functools
+from collections.abc import Sequence
+from math import trunc
+from typing import TYPE_CHECKING
+
+from google_slides_mcp.utils.numeric import require_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# Two-digit lowercase hex byte -> 0-1 component, so parsing a color is three
+# dict lookups instead of three int(..., 16) calls
+_HEX_TO_UNIT: dict[str, float] = {f"{i:02x}": i / 255 for i in range(256)}
+
+
+# Decks reuse a small theme palette, so a few hundred entries covers the
+# distinct colors of any realistic batch
+@functools.lru_cache(maxsize=256)
+def _parse_hex(hex_color: str) -> tuple[float, float, float]:
+    """Parse a hex color into 0-1 RGB components, caching repeated colors."""
+    hex_color = hex_color.lstrip("#")
+
+    if len(hex_color) == 3:
+        # Expand shorthand (e.g., "F53" -> "FF5533")
+        hex_color = "".join(c * 2 for c in hex_color)
+
+    if len(hex_color) != 6:
+        raise ValueError(f"Invalid hex color: {hex_color}")
+
+    lowered = hex_color.lower()
+    try:
+        r = _HEX_TO_UNIT[lowered[0:2]]
+        g = _HEX_TO_UNIT[lowered[2:4]]
+        b = _HEX_TO_UNIT[lowered[4:6]]
+    except KeyError as e:
+        raise ValueError(f"Invalid hex color: {hex_color}") from e
+
+    return r, g, b
+
 
 def hex_to_rgb(hex_color: str) -> dict[str, float]:
     """Convert hex color to Google Slides RGB format.
@@ -19,23 +59,65 @@ def hex_to_rgb(hex_color: str) -> dict[str, float]:
     Raises:
         ValueError: If hex_color is not a valid hex color string
     """
-    hex_color = hex_color.lstrip("#")
+    # Parsing is cached, but each caller gets its own dict since the result
+    # is embedded in request bodies that may be modified
+    r, g, b = _parse_hex(hex_color)
+    return {"red": r, "green": g, "blue": b}
 
-    if len(hex_color) == 3:
-        # Expand shorthand (e.g., "F53" -> "FF5533")
-        hex_color = "".join(c * 2 for c in hex_color)
 
-    if len(hex_color) != 6:
-        raise ValueError(f"Invalid hex color: {hex_color}")
+def preparsed_color(hex_color: str) -> dict[str, float]:
+    """Parse a hex color constant once, at module import.
+
+    Use for colors known ahead of time (e.g. THEME_PRIMARY =
+    preparsed_color("#4285F4")) so invalid literals fail at import and the
+    hot path skips parsing entirely via rgba_to_solid_fill_from_rgb. The
+    result is meant to be shared; don't embed it in request bodies directly.
+
+    Args:
+        hex_color: Hex color string (e.g., "#FF5733")
+
+    Returns:
+        Dictionary with "red", "green", "blue" keys, values 0-1
+
+    Raises:
+        ValueError: If hex_color is not a valid hex color string
+    """
+    return hex_to_rgb(hex_color)
+
+
+def hex_to_rgb_batch(colors: Sequence[str]) -> "np.ndarray":
+    """Convert many hex colors to Google Slides RGB values at once.
+
+    All colors are decoded in a single bytes.fromhex call and scaled with one
+    vectorized divide, which is much faster than calling hex_to_rgb per color
+    for palette-sized inputs. Requires NumPy.
+
+    Args:
+        colors: Hex color strings (e.g., ["#FF5733", "0F0"])
+
+    Returns:
+        Array of shape (N, 3) with red, green, blue columns, values 0-1.
+        Values are float64 and equal to those returned by hex_to_rgb.
+
+    Raises:
+        ValueError: If any color is not a valid hex color string
+        ImportError: If NumPy is not installed
+    """
+    np = require_numpy()
+
+    normalized = [c.lstrip("#") for c in colors]
+    normalized = [c[0] * 2 + c[1] * 2 + c[2] * 2 if len(c) == 3 else c for c in normalized]
 
     try:
-        r = int(hex_color[0:2], 16) / 255
-        g = int(hex_color[2:4], 16) / 255
-        b = int(hex_color[4:6], 16) / 255
-    except ValueError as e:
-        raise ValueError(f"Invalid hex color: {hex_color}") from e
+        raw = bytes.fromhex("".join(normalized))
+        if len(raw) != 3 * len(normalized) or any(len(c) != 6 for c in normalized):
+            raise ValueError
+    except ValueError:
+        # Parse individually, which reports the offending color and keeps
+        # edge-case inputs consistent with hex_to_rgb
+        return np.array([_parse_hex(c) for c in colors], dtype=np.float64)
 
-    return {"red": r, "green": g, "blue": b}
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3) / 255.0
 
 
 def rgb_to_hex(rgb: dict[str, float]) -> str:
@@ -50,37 +132,97 @@ def rgb_to_hex(rgb: dict[str, float]) -> str:
     Raises:
         ValueError: If rgb values are out of range
     """
+    # The API omits zero-valued channels, so missing keys mean 0
     r = rgb.get("red", 0)
     g = rgb.get("green", 0)
     b = rgb.get("blue", 0)
 
-    # Validate range
-    for name, value in [("red", r), ("green", g), ("blue", b)]:
-        if not 0 <= value <= 1:
-            raise ValueError(f"{name} value {value} out of range [0, 1]")
+    if not (0 <= r <= 1 and 0 <= g <= 1 and 0 <= b <= 1):
+        name, value = next(
+            (name, value)
+            for name, value in (("red", r), ("green", g), ("blue", b))
+            if not 0 <= value <= 1
+        )
+        raise ValueError(f"{name} value {value} out of range [0, 1]")
 
-    # Convert to 0-255 range and format as hex
-    r_int = int(round(r * 255))
-    g_int = int(round(g * 255))
-    b_int = int(round(b * 255))
+    # Convert to 0-255 (rounding halves up) and format all three bytes in one
+    # hex() call
+    return (
+        "#"
+        + bytes((trunc(r * 255 + 0.5), trunc(g * 255 + 0.5), trunc(b * 255 + 0.5))).hex().upper()
+    )
 
-    return f"#{r_int:02X}{g_int:02X}{b_int:02X}"
 
+def rgb_to_hex_batch(rgb: "npt.ArrayLike") -> list[str]:
+    """Convert many Google Slides RGB values to hex colors at once.
 
-def rgba_to_solid_fill(hex_color: str, alpha: float = 1.0) -> dict:
-    """Create a Google Slides solidFill object from a hex color.
+    Range checking, scaling, and rounding each run as one array operation,
+    and all colors are formatted with a single hex() call. Requires NumPy.
 
     Args:
-        hex_color: Hex color string
-        alpha: Opacity value 0-1 (default 1.0 = opaque)
+        rgb: Array of shape (N, 3) with red, green, blue columns, values 0-1
 
     Returns:
-        Dictionary suitable for solidFill in Google Slides API
+        Hex color strings with # prefix, equal to rgb_to_hex for each row
+
+    Raises:
+        ValueError: If the array is not (N, 3) or any value is out of range
+        ImportError: If NumPy is not installed
     """
-    rgb = hex_to_rgb(hex_color)
+    np = require_numpy()
+    values = np.asarray(rgb, dtype=np.float64)
+    if values.ndim != 2 or values.shape[1] != 3:
+        raise ValueError(f"Expected an array of shape (N, 3), got {values.shape}")
+
+    # Written so NaN counts as out of range
+    invalid = ~((values >= 0) & (values <= 1))
+    if invalid.any():
+        row, col = np.argwhere(invalid)[0]
+        name = ("red", "green", "blue")[col]
+        raise ValueError(f"{name} value {values[row, col]} out of range [0, 1]")
+
+    # Round halves up, matching rgb_to_hex
+    hex_digits = np.floor(values * 255 + 0.5).astype(np.uint8).tobytes().hex().upper()
+    return ["#" + hex_digits[i : i + 6] for i in range(0, len(hex_digits), 6)]
+
+
+def _build_solid_fill_from_rgb(r: float, g: float, b: float, alpha: float) -> dict:
+    """Build a solidFill object from 0-1 RGB components in a single pass."""
     return {
         "solidFill": {
-            "color": {"rgbColor": rgb},
+            "color": {"rgbColor": {"red": r, "green": g, "blue": b}},
             "alpha": alpha,
         }
     }
+
+
+def rgba_to_solid_fill(hex_color: str, alpha: float = 1.0) -> dict:
+    """Create a Google Slides solidFill object from a hex color.
+
+    Args:
+        hex_color: Hex color string
+        alpha: Opacity value 0-1 (default 1.0 = opaque)
+
+    Returns:
+        Dictionary suitable for solidFill in Google Slides API
+
+    Raises:
+        ValueError: If hex_color is not a valid hex color string
+    """
+    return _build_solid_fill_from_rgb(*_parse_hex(hex_color), alpha)
+
+
+def rgba_to_solid_fill_from_rgb(rgb: dict[str, float], alpha: float = 1.0) -> dict:
+    """Create a Google Slides solidFill object from already-parsed RGB values.
+
+    The components are copied, so a shared color from preparsed_color can be
+    passed safely.
+
+    Args:
+        rgb: Dictionary with "red", "green", "blue" keys, values 0-1
+        alpha: Opacity value 0-1 (default 1.0 = opaque)
+
+    Returns:
+        Dictionary suitable for solidFill in Google Slides API
+    """
+    return _build_solid_fill_from_rgb(rgb["red"], rgb["green"], rgb["blue"], alpha)
@@ -0,0 +1,51 @@
+"""Optional NumPy support for batch conversions.
+
+The batch variants of the color, unit, and transform helpers operate on
+whole palettes or decks at once using NumPy arrays. NumPy is an optional
+dependency (the "numeric" extra), so it is only imported when one of those
+helpers is called; the scalar helpers never need it.
+
+Loop kernels that NumPy cannot express as a single array operation are
+additionally compiled with Numba (the "jit" extra) when it is installed.
+"""
+
+from collections.abc import Callable
+from types import ModuleType
+
+
+def require_numpy() -> ModuleType:
+    """Import NumPy for a batch helper.
+
+    Returns:
+        The numpy module
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Batch conversions require NumPy. "
+            "Install it with: pip install 'google-slides-mcp[numeric]'"
+        ) from e
+    return numpy
+
+
+def optional_njit(func: Callable) -> Callable | None:
+    """Compile a loop kernel with Numba if it is installed.
+
+    Compiled kernels are cached on disk, so the compilation cost is paid
+    once per installation rather than once per process.
+
+    Args:
+        func: Kernel written in the Numba-compatible subset of Python
+
+    Returns:
+        The compiled kernel, or None if Numba is not installed
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(cache=True)(func)
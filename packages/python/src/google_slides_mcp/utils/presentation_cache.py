@@ -0,0 +1,168 @@
+"""Short-lived cache for presentation fetches.
+
+Agent workflows often inspect the same deck several times in a row (for
+example list_slides followed by get_element_info), and each full
+presentation fetch can be hundreds of KB of JSON. Presentations are cached
+per service, so cached bodies are never shared between users, and stale
+entries are revalidated by comparing revision IDs instead of refetching the
+whole presentation.
+"""
+
+import time
+import weakref
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from google_slides_mcp.services.slides_service import SlidesService
+
+# Seconds a cached presentation is returned without revalidation
+DEFAULT_MAX_AGE = 5.0
+
+
+@dataclass
+class CachedPresentation:
+    """A cached presentation body and when it was fetched."""
+
+    fetched_at: float
+    revision_id: str | None
+    body: dict
+
+    @cached_property
+    def element_index(self) -> dict[str, dict]:
+        """Map each slide page element's objectId to the element."""
+        return {
+            element["objectId"]: element
+            for slide in self.body.get("slides", [])
+            for element in slide.get("pageElements", [])
+            if "objectId" in element
+        }
+
+    @cached_property
+    def layouts_by_name(self) -> dict[str, dict]:
+        """Map each layout's upper-cased name to the layout, first match winning."""
+        layouts: dict[str, dict] = {}
+        for layout in self.body.get("layouts", []):
+            name = layout.get("layoutProperties", {}).get("name", "").upper()
+            layouts.setdefault(name, layout)
+        return layouts
+
+
+# Service -> presentation ID -> cached presentation
+_CACHE: "weakref.WeakKeyDictionary[SlidesService, dict[str, CachedPresentation]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _get_entry(
+    service: "SlidesService",
+    presentation_id: str,
+    max_age: float,
+) -> CachedPresentation:
+    entries = _CACHE.setdefault(service, {})
+    cached = entries.get(presentation_id)
+    now = time.monotonic()
+
+    if cached:
+        if now - cached.fetched_at < max_age:
+            return cached
+
+        # revisionId is only returned to editors; without it we can't tell
+        # whether the presentation changed, so fetch it again
+        if cached.revision_id is not None:
+            current = await service.get_presentation(presentation_id, fields="revisionId")
+            if current.get("revisionId") == cached.revision_id:
+                cached.fetched_at = now
+                return cached
+
+    body = await service.get_presentation(presentation_id)
+    entry = CachedPresentation(fetched_at=now, revision_id=body.get("revisionId"), body=body)
+    entries[presentation_id] = entry
+    return entry
+
+
+async def get_presentation_cached(
+    service: "SlidesService",
+    presentation_id: str,
+    max_age: float = DEFAULT_MAX_AGE,
+) -> dict:
+    """Get a presentation, reusing a recent fetch when possible.
+
+    Entries younger than max_age are returned as-is. Older entries are
+    revalidated with a request for just the presentation's revisionId and
+    reused if the presentation has not changed since.
+
+    Args:
+        service: The SlidesService to fetch with
+        presentation_id: The ID of the presentation to retrieve
+        max_age: Seconds a cached presentation is used without revalidation
+
+    Returns:
+        Presentation resource dictionary
+
+    Raises:
+        HttpError: If the API request fails
+    """
+    entry = await _get_entry(service, presentation_id, max_age)
+    return entry.body
+
+
+async def get_element_index(
+    service: "SlidesService",
+    presentation_id: str,
+    max_age: float = DEFAULT_MAX_AGE,
+) -> dict[str, dict]:
+    """Get an objectId -> page element index for a presentation's slides.
+
+    The index is built once per cached presentation, so repeated element
+    lookups on the same deck don't rescan every slide.
+
+    Args:
+        service: The SlidesService to fetch with
+        presentation_id: The ID of the presentation
+        max_age: Seconds a cached presentation is used without revalidation
+
+    Returns:
+        Dictionary mapping element object IDs to page elements
+
+    Raises:
+        HttpError: If the API request fails
+    """
+    entry = await _get_entry(service, presentation_id, max_age)
+    return entry.element_index
+
+
+async def get_layouts_by_name(
+    service: "SlidesService",
+    presentation_id: str,
+    max_age: float = DEFAULT_MAX_AGE,
+) -> dict[str, dict]:
+    """Get a presentation's layouts keyed by upper-cased layout name.
+
+    Args:
+        service: The SlidesService to fetch with
+        presentation_id: The ID of the presentation
+        max_age: Seconds a cached presentation is used without revalidation
+
+    Returns:
+        Dictionary mapping layout names (e.g. "TITLE_AND_BODY") to layouts
+
+    Raises:
+        HttpError: If the API request fails
+    """
+    entry = await _get_entry(service, presentation_id, max_age)
+    return entry.layouts_by_name
+
+
+def invalidate_presentation(presentation_id: str) -> None:
+    """Drop a presentation from every service's cache.
+
+    Called after any update so that later reads, by any user, see the
+    change immediately.
+
+    Args:
+        presentation_id: The ID of the presentation that changed
+    """
+    for entries in list(_CACHE.values()):
+        entries.pop(presentation_id, None)
@@ -0,0 +1,85 @@
+"""Typed Slides API request bodies for element creation.
+
+Creation tools build many nested request objects per call. Defining them as
+msgspec Structs makes each request a handful of compact objects instead of
+a tree of dicts, and lets the service layer encode them to JSON natively.
+Field names are snake_case in Python and camelCase on the wire.
+"""
+
+import msgspec
+
+
+class Dimension(msgspec.Struct, rename="camel"):
+    """A magnitude with a unit."""
+
+    magnitude: float
+    unit: str = "EMU"
+
+
+class Size(msgspec.Struct, rename="camel"):
+    """Width and height of a page element."""
+
+    width: Dimension
+    height: Dimension
+
+
+class AffineTransform(msgspec.Struct, rename="camel", kw_only=True):
+    """Page element transform; defaults to an unscaled, unsheared placement."""
+
+    scale_x: float = 1
+    scale_y: float = 1
+    shear_x: float = 0
+    shear_y: float = 0
+    translate_x: float
+    translate_y: float
+    unit: str = "EMU"
+
+
+class PageElementProperties(msgspec.Struct, rename="camel"):
+    """Where a new page element is placed."""
+
+    page_object_id: str
+    size: Size
+    transform: AffineTransform
+
+
+class CreateShapeRequest(msgspec.Struct, rename="camel"):
+    """Body of a createShape request."""
+
+    object_id: str
+    shape_type: str
+    element_properties: PageElementProperties
+
+
+class CreateImageRequest(msgspec.Struct, rename="camel"):
+    """Body of a createImage request."""
+
+    object_id: str
+    url: str
+    element_properties: PageElementProperties
+
+
+def element_properties(
+    page_object_id: str,
+    x_emu: int,
+    y_emu: int,
+    width_emu: int,
+    height_emu: int,
+) -> PageElementProperties:
+    """Build properties placing an element at a position with a size.
+
+    Args:
+        page_object_id: The slide the element is created on
+        x_emu: Left edge in EMU
+        y_emu: Top edge in EMU
+        width_emu: Width in EMU
+        height_emu: Height in EMU
+
+    Returns:
+        PageElementProperties with an identity-scale transform
+    """
+    return PageElementProperties(
+        page_object_id=page_object_id,
+        size=Size(Dimension(width_emu), Dimension(height_emu)),
+        transform=AffineTransform(translate_x=x_emu, translate_y=y_emu),
+    )
@@ -4,37 +4,41 @@ Google Slides uses affine transforms for positioning and sizing elements.
 This module provides helpers for calculating transforms without manual EMU math.
 """
 
-from dataclasses import dataclass
-from typing import Literal
+import functools
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
 
+from google_slides_mcp.utils.numeric import optional_njit, require_numpy
 from google_slides_mcp.utils.units import (
     SLIDE_HEIGHT_16_9_EMU,
     SLIDE_HEIGHT_16_10_EMU,
     SLIDE_HEIGHT_4_3_EMU,
     SLIDE_WIDTH_EMU,
+    emu_to_inches,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SlideSize:
-    """Represents slide dimensions in EMU."""
+    """Represents slide dimensions in EMU.
+
+    Instances are immutable, so the inch conversions are computed once at
+    construction and stored in slots alongside the EMU dimensions.
+    """
 
     width_emu: int
     height_emu: int
+    width_inches: float = field(init=False, repr=False, compare=False)
+    height_inches: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def width_inches(self) -> float:
-        """Width in inches."""
-        from google_slides_mcp.utils.units import emu_to_inches
-
-        return emu_to_inches(self.width_emu)
-
-    @property
-    def height_inches(self) -> float:
-        """Height in inches."""
-        from google_slides_mcp.utils.units import emu_to_inches
-
-        return emu_to_inches(self.height_emu)
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "width_inches", emu_to_inches(self.width_emu))
+        object.__setattr__(self, "height_inches", emu_to_inches(self.height_emu))
 
 
 # Predefined slide sizes
@@ -65,6 +69,87 @@ def calculate_center_position(
     return x, y
 
 
+def _center_positions_impl(
+    slide_width: int,
+    slide_height: int,
+    widths: "np.ndarray",
+    heights: "np.ndarray",
+    out: "np.ndarray",
+) -> None:
+    """Fill out[i] with the centered (x, y) of element i."""
+    for i in range(widths.size):
+        out[i, 0] = (slide_width - widths[i]) // 2
+        out[i, 1] = (slide_height - heights[i]) // 2
+
+
+@functools.cache
+def _center_positions_kernel() -> Callable | None:
+    """Get the Numba-compiled centering kernel, compiling it on first use."""
+    return optional_njit(_center_positions_impl)
+
+
+def calculate_center_positions_batch(
+    slide_size: SlideSize,
+    widths_emu: "npt.ArrayLike",
+    heights_emu: "npt.ArrayLike",
+) -> "np.ndarray":
+    """Calculate centered positions for many elements at once.
+
+    Batch form of calculate_center_position. Runs a Numba-compiled loop when
+    Numba is installed and falls back to vectorized NumPy otherwise.
+    Requires NumPy.
+
+    Args:
+        slide_size: The slide dimensions
+        widths_emu: Element widths in EMU
+        heights_emu: Element heights in EMU, one per width
+
+    Returns:
+        int64 array of shape (N, 2) with the x and y of each element in EMU
+
+    Raises:
+        ValueError: If widths and heights have different shapes
+    """
+    np = require_numpy()
+    widths = np.asarray(widths_emu, dtype=np.int64).ravel()
+    heights = np.asarray(heights_emu, dtype=np.int64).ravel()
+    if widths.shape != heights.shape:
+        raise ValueError("widths_emu and heights_emu must have the same length")
+
+    kernel = _center_positions_kernel()
+    if kernel is None:
+        return np.stack(
+            ((slide_size.width_emu - widths) // 2, (slide_size.height_emu - heights) // 2),
+            axis=1,
+        )
+
+    out = np.empty((widths.size, 2), dtype=np.int64)
+    kernel(slide_size.width_emu, slide_size.height_emu, widths, heights, out)
+    return out
+
+
+# Offset along one axis for each alignment, as a function of
+# (slide extent, element extent, margin). Looked up per element instead of
+# walking an if/elif ladder.
+_AxisOffset = Callable[[int, int, int], int]
+
+_H_ALIGN: dict[str | None, _AxisOffset] = {
+    "left": lambda slide, element, margin: margin,
+    "center": lambda slide, element, margin: (slide - element) // 2,
+    "right": lambda slide, element, margin: slide - element - margin,
+}
+_V_ALIGN: dict[str | None, _AxisOffset] = {
+    "top": lambda slide, element, margin: margin,
+    "center": lambda slide, element, margin: (slide - element) // 2,
+    "bottom": lambda slide, element, margin: slide - element - margin,
+}
+
+
+# No alignment (or an unrecognized one) places the element at the slide edge
+def _unaligned(slide: int, element: int, margin: int) -> int:
+    return 0
+
+
 def calculate_alignment_position(
     slide_size: SlideSize,
     element_width_emu: int,
@@ -86,29 +171,26 @@ def calculate_alignment_position(
     Returns:
         Tuple of (x, y) position in EMU
     """
-    # Horizontal position
-    if horizontal == "left":
-        x = margin_emu
-    elif horizontal == "center":
-        x = (slide_size.width_emu - element_width_emu) // 2
-    elif horizontal == "right":
-        x = slide_size.width_emu - element_width_emu - margin_emu
-    else:
-        x = 0
-
-    # Vertical position
-    if vertical == "top":
-        y = margin_emu
-    elif vertical == "center":
-        y = (slide_size.height_emu - element_height_emu) // 2
-    elif vertical == "bottom":
-        y = slide_size.height_emu - element_height_emu - margin_emu
-    else:
-        y = 0
-
+    slide_width = slide_size.width_emu
+    slide_height = slide_size.height_emu
+    x = _H_ALIGN.get(horizontal, _unaligned)(slide_width, element_width_emu, margin_emu)
+    y = _V_ALIGN.get(vertical, _unaligned)(slide_height, element_height_emu, margin_emu)
     return x, y
 
 
+# Key order and fixed values of every absolute transform; copied per call
+# rather than building the 7-key dict from a literal
+_IDENTITY_TRANSFORM_TEMPLATE = {
+    "scaleX": 1.0,
+    "scaleY": 1.0,
+    "shearX": 0,
+    "shearY": 0,
+    "translateX": 0,
+    "translateY": 0,
+    "unit": "EMU",
+}
+
+
 def build_absolute_transform(
     translate_x_emu: int,
     translate_y_emu: int,
@@ -138,15 +220,12 @@ def build_absolute_transform(
     if rotation_angle != 0.0:
         raise NotImplementedError("Rotation transforms are not yet supported")
 
-    return {
-        "scaleX": scale_x,
-        "scaleY": scale_y,
-        "shearX": 0,
-        "shearY": 0,
-        "translateX": translate_x_emu,
-        "translateY": translate_y_emu,
-        "unit": "EMU",
-    }
+    transform = _IDENTITY_TRANSFORM_TEMPLATE.copy()
+    transform["scaleX"] = scale_x
+    transform["scaleY"] = scale_y
+    transform["translateX"] = translate_x_emu
+    transform["translateY"] = translate_y_emu
+    return transform
 
 
 def build_size(width_emu: int, height_emu: int) -> dict:
@@ -165,6 +244,31 @@ def build_size(width_emu: int, height_emu: int) -> dict:
     }
 
 
+def build_sizes_batch(dims_emu: "npt.ArrayLike") -> list[dict]:
+    """Build size objects for many elements at once.
+
+    Batch form of build_size for requests built from array layouts. The
+    array is converted to Python ints in one tolist() call, so the results
+    contain no NumPy scalars and serialize like build_size output.
+    Requires NumPy.
+
+    Args:
+        dims_emu: Widths and heights in EMU, shape (N, 2)
+
+    Returns:
+        List of N size dictionaries suitable for Google Slides API
+    """
+    np = require_numpy()
+    dims = np.asarray(dims_emu, dtype=np.int64).reshape(-1, 2).tolist()
+    return [
+        {
+            "width": {"magnitude": width, "unit": "EMU"},
+            "height": {"magnitude": height, "unit": "EMU"},
+        }
+        for width, height in dims
+    ]
+
+
 def extract_element_bounds(page_element: dict) -> tuple[int, int, int, int]:
     """Extract position and size from a page element's transform.
 
@@ -203,3 +307,45 @@ def extract_element_bounds(page_element: dict) -> tuple[int, int, int, int]:
     height = int(intrinsic_height * abs(scale_y))
 
     return x, y, width, height
+
+
+def extract_all_element_bounds(page_elements: Sequence[dict]) -> "np.ndarray":
+    """Extract position and size of many page elements into one array.
+
+    Batch form of extract_element_bounds. The struct-of-arrays result lets
+    callers compute centroids, extents, or overlaps with column operations
+    (e.g. bounds[:, 0] for every x) instead of looping over tuples.
+    Requires NumPy.
+
+    Args:
+        page_elements: pageElement objects from Google Slides API
+
+    Returns:
+        int64 array of shape (N, 4) with columns x, y, width, height in EMU,
+        where width/height are the rendered dimensions
+
+    Raises:
+        ValueError: If any element doesn't have transform or size information
+    """
+    np = require_numpy()
+
+    def values() -> Iterator[int]:
+        # Same arithmetic as extract_element_bounds, inlined and yielding
+        # x, y, width, height for each element in turn
+        for page_element in page_elements:
+            transform = page_element.get("transform")
+            size = page_element.get("size")
+            if not transform or not size:
+                raise ValueError("Page element missing transform or size information")
+
+            transform_get = transform.get
+            intrinsic_width = size.get("width", {}).get("magnitude", 0)
+            intrinsic_height = size.get("height", {}).get("magnitude", 0)
+            yield int(transform_get("translateX", 0))
+            yield int(transform_get("translateY", 0))
+            yield int(intrinsic_width * abs(transform_get("scaleX", 1.0)))
+            yield int(intrinsic_height * abs(transform_get("scaleY", 1.0)))
+
+    # With count given, fromiter allocates the whole array up front and
+    # fills it in a single pass, with no per-element tuples or row writes
+    return np.fromiter(values(), dtype=np.int64, count=4 * len(page_elements)).reshape(-1, 4)
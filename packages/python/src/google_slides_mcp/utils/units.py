@@ -4,6 +4,14 @@ Google Slides uses English Metric Units (EMU) for all positioning and sizing.
 This module provides conversion functions between EMUs and human-friendly units.
 """
 
+from typing import TYPE_CHECKING
+
+from google_slides_mcp.utils.numeric import require_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
 # EMU conversion constants
 EMU_PER_INCH = 914400
 EMU_PER_POINT = 12700
@@ -21,8 +29,14 @@ SLIDE_HEIGHT_4_3_EMU = 6858000  # 7.5 inches
 # 16:10
 SLIDE_HEIGHT_16_10_EMU = 5715000  # 6.25 inches
 
+# The conversion functions below run once or more per element during layout,
+# so each binds its constant as a private default argument (a fast local load
+# rather than a global lookup). EMU-to-unit conversions keep true division:
+# multiplying by a precomputed reciprocal is off by one ulp for many inputs
+# (e.g. 182880 EMU would report 0.19999999999999998 inches instead of 0.2).
 
-def inches_to_emu(inches: float) -> int:
+
+def inches_to_emu(inches: float, _per_inch: int = EMU_PER_INCH) -> int:
     """Convert inches to EMU (English Metric Units).
 
     Args:
@@ -31,10 +45,10 @@ def inches_to_emu(inches: float) -> int:
     Returns:
         Equivalent value in EMU as an integer
     """
-    return int(inches * EMU_PER_INCH)
+    return int(inches * _per_inch)
 
 
-def emu_to_inches(emu: int) -> float:
+def emu_to_inches(emu: int, _per_inch: int = EMU_PER_INCH) -> float:
     """Convert EMU to inches.
 
     Args:
@@ -43,10 +57,10 @@ def emu_to_inches(emu: int) -> float:
     Returns:
         Equivalent value in inches
     """
-    return emu / EMU_PER_INCH
+    return emu / _per_inch
 
 
-def points_to_emu(points: float) -> int:
+def points_to_emu(points: float, _per_point: int = EMU_PER_POINT) -> int:
     """Convert points to EMU.
 
     Points are commonly used for font sizes.
@@ -57,10 +71,10 @@ def points_to_emu(points: float) -> int:
     Returns:
         Equivalent value in EMU as an integer
     """
-    return int(points * EMU_PER_POINT)
+    return int(points * _per_point)
 
 
-def emu_to_points(emu: int) -> float:
+def emu_to_points(emu: int, _per_point: int = EMU_PER_POINT) -> float:
     """Convert EMU to points.
 
     Args:
@@ -69,10 +83,10 @@ def emu_to_points(emu: int) -> float:
     Returns:
         Equivalent value in points
     """
-    return emu / EMU_PER_POINT
+    return emu / _per_point
 
 
-def cm_to_emu(cm: float) -> int:
+def cm_to_emu(cm: float, _per_cm: int = EMU_PER_CM) -> int:
     """Convert centimeters to EMU.
 
     Args:
@@ -81,10 +95,10 @@ def cm_to_emu(cm: float) -> int:
     Returns:
         Equivalent value in EMU as an integer
     """
-    return int(cm * EMU_PER_CM)
+    return int(cm * _per_cm)
 
 
-def emu_to_cm(emu: int) -> float:
+def emu_to_cm(emu: int, _per_cm: int = EMU_PER_CM) -> float:
     """Convert EMU to centimeters.
 
     Args:
@@ -93,10 +107,15 @@ def emu_to_cm(emu: int) -> float:
     Returns:
         Equivalent value in centimeters
     """
-    return emu / EMU_PER_CM
+    return emu / _per_cm
 
 
-def pixels_to_emu(pixels: float, dpi: int = 96) -> int:
+def pixels_to_emu(
+    pixels: float,
+    dpi: int = 96,
+    _per_pixel: int = EMU_PER_PIXEL_96DPI,
+    _per_inch: int = EMU_PER_INCH,
+) -> int:
     """Convert pixels to EMU at a given DPI.
 
     Args:
@@ -107,11 +126,16 @@ def pixels_to_emu(pixels: float, dpi: int = 96) -> int:
         Equivalent value in EMU as an integer
     """
     if dpi == 96:
-        return int(pixels * EMU_PER_PIXEL_96DPI)
-    return int(pixels * EMU_PER_INCH / dpi)
+        return int(pixels * _per_pixel)
+    return int(pixels * _per_inch / dpi)
 
 
-def emu_to_pixels(emu: int, dpi: int = 96) -> float:
+def emu_to_pixels(
+    emu: int,
+    dpi: int = 96,
+    _per_pixel: int = EMU_PER_PIXEL_96DPI,
+    _per_inch: int = EMU_PER_INCH,
+) -> float:
     """Convert EMU to pixels at a given DPI.
 
     Args:
@@ -122,5 +146,72 @@ def emu_to_pixels(emu: int, dpi: int = 96) -> float:
         Equivalent value in pixels
     """
     if dpi == 96:
-        return emu / EMU_PER_PIXEL_96DPI
-    return emu * dpi / EMU_PER_INCH
+        return emu / _per_pixel
+    return emu * dpi / _per_inch
+
+
+def _to_emu_array(values: "npt.ArrayLike", emu_per_unit: float) -> "np.ndarray":
+    """Scale values to EMU in one vectorized pass, truncating like int()."""
+    np = require_numpy()
+    return (np.asarray(values, dtype=np.float64) * emu_per_unit).astype(np.int64)
+
+
+def inches_to_emu_array(inches: "npt.ArrayLike") -> "np.ndarray":
+    """Convert an array of inch values to EMU.
+
+    Batch form of inches_to_emu for laying out many elements at once.
+    Requires NumPy.
+
+    Args:
+        inches: Values in inches (array or sequence of numbers)
+
+    Returns:
+        int64 array of EMU values with the same shape
+    """
+    return _to_emu_array(inches, EMU_PER_INCH)
+
+
+def points_to_emu_array(points: "npt.ArrayLike") -> "np.ndarray":
+    """Convert an array of point values to EMU.
+
+    Batch form of points_to_emu. Requires NumPy.
+
+    Args:
+        points: Values in points (array or sequence of numbers)
+
+    Returns:
+        int64 array of EMU values with the same shape
+    """
+    return _to_emu_array(points, EMU_PER_POINT)
+
+
+def cm_to_emu_array(cm: "npt.ArrayLike") -> "np.ndarray":
+    """Convert an array of centimeter values to EMU.
+
+    Batch form of cm_to_emu. Requires NumPy.
+
+    Args:
+        cm: Values in centimeters (array or sequence of numbers)
+
+    Returns:
+        int64 array of EMU values with the same shape
+    """
+    return _to_emu_array(cm, EMU_PER_CM)
+
+
+def pixels_to_emu_array(pixels: "npt.ArrayLike", dpi: int = 96) -> "np.ndarray":
+    """Convert an array of pixel values to EMU at a given DPI.
+
+    Batch form of pixels_to_emu. Requires NumPy.
+
+    Args:
+        pixels: Values in pixels (array or sequence of numbers)
+        dpi: Dots per inch (default 96)
+
+    Returns:
+        int64 array of EMU values with the same shape
+    """
+    if dpi == 96:
+        return _to_emu_array(pixels, EMU_PER_PIXEL_96DPI)
+    np = require_numpy()
+    return (np.asarray(pixels, dtype=np.float64) * EMU_PER_INCH / dpi).astype(np.int64)
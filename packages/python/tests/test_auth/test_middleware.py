@@ -0,0 +1,112 @@
+"""Tests for the Google auth middleware's stored-credentials handling."""
+
+from datetime import UTC, datetime, timedelta
+
+import orjson
+import pytest
+
+from google_slides_mcp.auth import paths
+from google_slides_mcp.auth.middleware import GoogleAuthMiddleware
+
+
+@pytest.fixture
+def stored_credentials() -> dict:
+    """Return a credentials file payload with a future expiry."""
+    expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+    return {
+        "token": "access",
+        "refresh_token": "refresh",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "client_id": "client",
+        "client_secret": "secret",
+        "scopes": ["https://www.googleapis.com/auth/presentations"],
+        "expiry": expiry.isoformat(),
+    }
+
+
+class TestLoadStoredCredentials:
+    """Tests for loading credentials from the credentials file."""
+
+    async def test_loads_valid_file(self, tmp_path, stored_credentials):
+        """Test that a valid file yields unexpired credentials."""
+        path = tmp_path / "credentials.json"
+        path.write_bytes(orjson.dumps(stored_credentials))
+
+        credentials = await GoogleAuthMiddleware(path)._load_stored_credentials()
+
+        assert credentials.token == "access"
+        assert credentials.refresh_token == "refresh"
+        assert credentials.expiry is not None
+        assert not credentials.expired
+
+    async def test_missing_file(self, tmp_path):
+        """Test that a missing file raises ValueError."""
+        with pytest.raises(ValueError, match="No credentials found"):
+            await GoogleAuthMiddleware(tmp_path / "missing.json")._load_stored_credentials()
+
+    async def test_invalid_file(self, tmp_path):
+        """Test that malformed or incomplete files raise ValueError."""
+        path = tmp_path / "credentials.json"
+        path.write_bytes(b"{not json")
+        with pytest.raises(ValueError, match="Invalid credentials file"):
+            await GoogleAuthMiddleware(path)._load_stored_credentials()
+
+        path.write_bytes(orjson.dumps({"token": "access"}))
+        with pytest.raises(ValueError, match="Invalid credentials file"):
+            await GoogleAuthMiddleware(path)._load_stored_credentials()
+
+    async def test_missing_refresh_token(self, tmp_path, stored_credentials):
+        """Test that a file without a refresh token is rejected by the schema."""
+        del stored_credentials["refresh_token"]
+        path = tmp_path / "credentials.json"
+        path.write_bytes(orjson.dumps(stored_credentials))
+        with pytest.raises(ValueError, match="Invalid credentials file"):
+            await GoogleAuthMiddleware(path)._load_stored_credentials()
+
+    async def test_save_updates_token(self, tmp_path, stored_credentials):
+        """Test that saving refreshed credentials preserves other fields."""
+        path = tmp_path / "credentials.json"
+        path.write_bytes(orjson.dumps(stored_credentials))
+        middleware = GoogleAuthMiddleware(path)
+        credentials = await middleware._load_stored_credentials()
+
+        credentials.token = "refreshed"
+        await middleware._save_credentials(credentials)
+
+        saved = orjson.loads(path.read_bytes())
+        assert saved["token"] == "refreshed"
+        assert saved["refresh_token"] == "refresh"
+        assert saved["scopes"] == stored_credentials["scopes"]
+
+    async def test_save_preserves_unknown_fields(self, tmp_path, stored_credentials):
+        """Test that fields outside the schema survive, and none are added."""
+        stored_credentials["universe_domain"] = "googleapis.com"
+        del stored_credentials["scopes"]
+        path = tmp_path / "credentials.json"
+        path.write_bytes(orjson.dumps(stored_credentials))
+        middleware = GoogleAuthMiddleware(path)
+        credentials = await middleware._load_stored_credentials()
+
+        credentials.token = "refreshed"
+        await middleware._save_credentials(credentials)
+
+        saved = orjson.loads(path.read_bytes())
+        assert saved["universe_domain"] == "googleapis.com"
+        assert "scopes" not in saved
+
+
+class TestCredentialsFilePath:
+    """Tests for resolving the credentials file location."""
+
+    def test_default_path_resolved_lazily(self, monkeypatch, tmp_path):
+        """Test that the default path is not resolved at construction."""
+        calls = []
+        monkeypatch.setattr(
+            paths, "credentials_file", lambda: calls.append(1) or tmp_path / "c.json"
+        )
+
+        middleware = GoogleAuthMiddleware()
+        assert calls == []
+        assert middleware.credentials_file == tmp_path / "c.json"
+        assert middleware.credentials_file == tmp_path / "c.json"
+        assert calls == [1]
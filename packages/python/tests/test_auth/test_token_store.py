@@ -0,0 +1,63 @@
+"""Tests for credential token storage."""
+
+import stat
+
+from google_slides_mcp.auth.token_store import FileTokenStore, InMemoryTokenStore
+
+
+class TestInMemoryTokenStore:
+    """Tests for the in-memory token store."""
+
+    async def test_roundtrip(self):
+        """Test storing, retrieving, and deleting credentials."""
+        store = InMemoryTokenStore()
+        await store.store("user", {"token": "abc"})
+        assert await store.retrieve("user") == {"token": "abc"}
+        await store.delete("user")
+        assert await store.retrieve("user") is None
+
+
+class TestFileTokenStore:
+    """Tests for the file-based token store."""
+
+    async def test_roundtrip(self, tmp_path):
+        """Test storing, retrieving, and deleting credentials."""
+        store = FileTokenStore(tmp_path)
+        credentials = {"token": "abc", "refresh_token": "def", "scopes": ["a", "b"]}
+        await store.store("user@example.com", credentials)
+        assert await store.retrieve("user@example.com") == credentials
+        await store.delete("user@example.com")
+        assert await store.retrieve("user@example.com") is None
+
+    async def test_missing_user(self, tmp_path):
+        """Test that unknown users return None and delete is a no-op."""
+        store = FileTokenStore(tmp_path)
+        assert await store.retrieve("nobody") is None
+        await store.delete("nobody")
+
+    async def test_file_permissions(self, tmp_path):
+        """Test that credential files are readable by the owner only."""
+        store = FileTokenStore(tmp_path)
+        await store.store("user", {"token": "abc"})
+        mode = stat.S_IMODE((tmp_path / "user.json").stat().st_mode)
+        assert mode == 0o600
+
+    async def test_sanitized_filename(self, tmp_path):
+        """Test that user IDs are sanitized for use as filenames."""
+        store = FileTokenStore(tmp_path)
+        await store.store("user@example.com", {"token": "abc"})
+        assert (tmp_path / "user_example_com.json").exists()
+
+    async def test_sanitized_non_ascii_filename(self, tmp_path):
+        """Test that non-ASCII letters are kept and other symbols replaced."""
+        store = FileTokenStore(tmp_path)
+        await store.store("josé·x", {"token": "abc"})
+        assert (tmp_path / "josé_x.json").exists()
+
+    async def test_overwrite_is_atomic(self, tmp_path):
+        """Test that rewriting credentials replaces the file without leftovers."""
+        store = FileTokenStore(tmp_path)
+        await store.store("user", {"token": "old"})
+        await store.store("user", {"token": "new"})
+        assert await store.retrieve("user") == {"token": "new"}
+        assert [p.name for p in tmp_path.iterdir()] == ["user.json"]
@@ -0,0 +1 @@
+"""Tests for Google API service helpers."""
@@ -0,0 +1,107 @@
+"""Tests for the Drive service wrapper."""
+
+import gc
+import re
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import httplib2
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+
+from google_slides_mcp.services import drive_service
+from google_slides_mcp.services.drive_service import DriveService
+
+
+class FakeBatchHttp:
+    """Answers Drive batch calls, failing the copies of the given file IDs."""
+
+    def __init__(self, failing: set[str]) -> None:
+        self.failing = failing
+        self.calls = 0
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        self.calls += 1
+        parts = []
+        for content_id, file_id in re.findall(
+            r"Content-ID: (<[^>]+>).*?/files/([^/]+)/copy", body, re.S
+        ):
+            if file_id in self.failing:
+                status, payload = "404 Not Found", '{"error": {"message": "File not found"}}'
+            else:
+                status, payload = "200 OK", f'{{"id": "copy-of-{file_id}"}}'
+            parts.append(
+                f"--batch\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id[1:]}\r\n\r\n"
+                f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n\r\n{payload}\r\n"
+            )
+        content = "".join(parts) + "--batch--\r\n"
+        response = httplib2.Response(
+            {"status": 200, "content-type": 'multipart/mixed; boundary="batch"'}
+        )
+        return response, content.encode()
+
+
+class FakeBatchDriveService(DriveService):
+    """DriveService that sends its requests to a FakeBatchHttp."""
+
+    def __init__(self, http: FakeBatchHttp) -> None:
+        super().__init__(Credentials(token="token"))
+        self.http = http
+
+    def _run_with_http(self, execute):
+        return execute(http=self.http)
+
+
+class TestDriveResource:
+    """Tests for the shared Drive resource."""
+
+    def test_resource_shared_across_credentials(self):
+        """Test that services for different credentials share one resource."""
+        first = DriveService(Credentials(token="first"))
+        second = DriveService(Credentials(token="second"))
+        assert first._service is second._service
+
+    def test_credentials_not_retained(self):
+        """Test that the shared resource doesn't keep credentials alive."""
+        credentials = Credentials(token="token")
+        ref = weakref.ref(credentials)
+        service = DriveService(credentials)
+        del service, credentials
+        gc.collect()
+        assert ref() is None
+
+
+class TestThreadHttp:
+    """Tests for per-thread Http reuse."""
+
+    def test_reused_within_thread(self):
+        """Test that calls on one thread share an Http, other threads get their own."""
+        service = DriveService(Credentials(token="token"))
+        first = service._thread_http()
+        assert service._thread_http() is first
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(service._thread_http).result()
+        assert other is not first
+        assert other.credentials is service._credentials
+
+
+class TestBatchCopyFiles:
+    """Tests for batched copies."""
+
+    async def test_partial_failure_keeps_results(self, monkeypatch):
+        """Test that a failed copy doesn't discard copies made in any group."""
+        monkeypatch.setattr(drive_service, "MAX_BATCH_SIZE", 2)
+        http = FakeBatchHttp(failing={"b"})
+        service = FakeBatchDriveService(http)
+
+        results = await service.batch_copy_files(
+            [{"file_id": file_id, "new_name": file_id.upper()} for file_id in "abcd"]
+        )
+
+        assert http.calls == 2
+        assert results[0] == {"id": "copy-of-a"}
+        assert isinstance(results[1], HttpError)
+        assert results[1].resp.status == 404
+        assert results[2:] == [{"id": "copy-of-c"}, {"id": "copy-of-d"}]
@@ -0,0 +1,68 @@
+"""Tests for retrying transient Google API errors."""
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from google_slides_mcp.services import retry
+from google_slides_mcp.services.retry import RATE_LIMIT_STATUSES, with_retries
+
+
+def http_error(status: int, **headers: str) -> HttpError:
+    """Build an HttpError with the given status and response headers."""
+    return HttpError(httplib2.Response({"status": status, **headers}), b"")
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    """Record backoff delays instead of sleeping."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(retry.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def failing_call(*errors: HttpError):
+    """Return a call that raises each error in turn, then succeeds."""
+    remaining = list(errors)
+
+    async def call() -> str:
+        if remaining:
+            raise remaining.pop(0)
+        return "ok"
+
+    return call
+
+
+class TestWithRetries:
+    """Tests for with_retries."""
+
+    async def test_retries_transient_errors(self, sleeps):
+        call = failing_call(http_error(429), http_error(500), http_error(503))
+        assert await with_retries(call) == "ok"
+        assert len(sleeps) == 3
+        assert 1 <= sleeps[0] < 2
+        assert 4 <= sleeps[2] < 5
+
+    async def test_honors_retry_after(self, sleeps):
+        assert await with_retries(failing_call(http_error(429, **{"retry-after": "7"}))) == "ok"
+        assert sleeps == [7.0]
+
+    async def test_does_not_retry_client_errors(self, sleeps):
+        with pytest.raises(HttpError):
+            await with_retries(failing_call(http_error(404)))
+        assert sleeps == []
+
+    async def test_respects_status_set(self, sleeps):
+        with pytest.raises(HttpError):
+            await with_retries(failing_call(http_error(500)), statuses=RATE_LIMIT_STATUSES)
+        assert sleeps == []
+
+    async def test_gives_up_after_max_retries(self, sleeps):
+        call = failing_call(*(http_error(503) for _ in range(3)))
+        with pytest.raises(HttpError):
+            await with_retries(call, max_retries=2)
+        assert len(sleeps) == 2
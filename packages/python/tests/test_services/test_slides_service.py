@@ -0,0 +1,51 @@
+"""Tests for the Slides service wrapper."""
+
+import httplib2
+import pytest
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+
+from google_slides_mcp.services import retry
+from google_slides_mcp.services.slides_service import SlidesService
+
+
+class FailingSlidesService(SlidesService):
+    """SlidesService whose API calls fail with queued statuses, then succeed."""
+
+    def __init__(self, *statuses: int) -> None:
+        super().__init__(Credentials(token="token"))
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    async def _execute(self, request):
+        self.calls += 1
+        if self.statuses:
+            raise HttpError(httplib2.Response({"status": self.statuses.pop(0)}), b"")
+        return {"replies": []}
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch) -> None:
+    """Skip backoff delays."""
+
+    async def fake_sleep(delay: float) -> None:
+        pass
+
+    monkeypatch.setattr(retry.asyncio, "sleep", fake_sleep)
+
+
+class TestBatchUpdateRetries:
+    """Tests for which batchUpdate failures are retried."""
+
+    async def test_rate_limit_retried(self):
+        """Test that a rejected batch is sent again."""
+        service = FailingSlidesService(429)
+        assert await service.batch_update("pres", [{"createShape": {}}]) == {"replies": []}
+        assert service.calls == 2
+
+    async def test_server_error_not_retried(self):
+        """Test that a 500, which may follow a committed batch, is not replayed."""
+        service = FailingSlidesService(500)
+        with pytest.raises(HttpError):
+            await service.batch_update("pres", [{"createShape": {}}])
+        assert service.calls == 1
@@ -0,0 +1 @@
+"""Tests for MCP tools."""
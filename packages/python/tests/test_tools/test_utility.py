@@ -0,0 +1,32 @@
+"""Tests for utility tool helpers."""
+
+from google_slides_mcp.tools.utility import _slide_title
+
+
+def title_placeholder(*runs: str) -> dict:
+    """Build a TITLE placeholder page element with the given text runs."""
+    return {
+        "shape": {
+            "placeholder": {"type": "TITLE"},
+            "text": {"textElements": [{"textRun": {"content": run}} for run in runs]},
+        }
+    }
+
+
+class TestSlideTitle:
+    """Tests for slide title extraction."""
+
+    def test_first_non_empty_run(self):
+        """Test that the first non-empty run of the title is used."""
+        slide = {"pageElements": [{"shape": {}}, title_placeholder("\n", " Intro \n", "More")]}
+        assert _slide_title(slide) == "Intro"
+
+    def test_only_first_title_placeholder(self):
+        """Test that an empty first title placeholder gives an empty title."""
+        slide = {"pageElements": [title_placeholder("  "), title_placeholder("Second")]}
+        assert _slide_title(slide) == ""
+
+    def test_no_title(self):
+        """Test that slides without a title placeholder have an empty title."""
+        assert _slide_title({}) == ""
+        assert _slide_title({"pageElements": [{"image": {}}]}) == ""
@@ -2,7 +2,14 @@
 
 import pytest
 
-from google_slides_mcp.utils.colors import hex_to_rgb, rgb_to_hex
+from google_slides_mcp.utils.colors import (
+    _parse_hex,
+    hex_to_rgb,
+    preparsed_color,
+    rgb_to_hex,
+    rgba_to_solid_fill,
+    rgba_to_solid_fill_from_rgb,
+)
 
 
 class TestHexToRgb:
@@ -35,6 +42,26 @@ class TestHexToRgb:
             hex_to_rgb("invalid")
         with pytest.raises(ValueError):
             hex_to_rgb("#GG0000")
+        with pytest.raises(ValueError):
+            hex_to_rgb("#+F0000")
+
+    def test_mixed_case(self):
+        """Test that lowercase and mixed-case digits parse the same."""
+        assert hex_to_rgb("#aBcDeF") == hex_to_rgb("#ABCDEF")
+        assert hex_to_rgb("#abcdef")["red"] == 0xAB / 255
+
+    def test_returns_independent_dicts(self):
+        """Test that repeated conversions don't share a mutable result."""
+        first = hex_to_rgb("#336699")
+        first["red"] = 0.0
+        assert hex_to_rgb("#336699")["red"] == 0.2
+
+    def test_repeated_colors_hit_cache(self):
+        """Test that repeated theme colors are parsed only once."""
+        _parse_hex.cache_clear()
+        for _ in range(10):
+            hex_to_rgb("#4285F4")
+        assert _parse_hex.cache_info().misses == 1
 
 
 class TestRgbToHex:
@@ -57,6 +84,18 @@ class TestRgbToHex:
             rgb_to_hex({"red": 1.5, "green": 0.0, "blue": 0.0})
         with pytest.raises(ValueError):
             rgb_to_hex({"red": -0.1, "green": 0.0, "blue": 0.0})
+        with pytest.raises(ValueError, match="blue"):
+            rgb_to_hex({"red": 0.5, "green": 0.5, "blue": 2})
+
+    def test_missing_channels_are_zero(self):
+        """Test that channels omitted by the API count as 0."""
+        assert rgb_to_hex({"green": 1.0}) == "#00FF00"
+        assert rgb_to_hex({}) == "#000000"
+
+    def test_rounds_half_up(self):
+        """Test that values halfway between bytes round up."""
+        assert rgb_to_hex({"red": 0.5}) == "#800000"
+        assert rgb_to_hex({"red": 1 / 510}) == "#010000"
 
 
 class TestRoundtrip:
@@ -69,3 +108,29 @@ class TestRoundtrip:
             rgb = hex_to_rgb(color)
             result = rgb_to_hex(rgb)
             assert result == color
+
+
+class TestRgbaToSolidFill:
+    """Tests for solidFill construction."""
+
+    def test_solid_fill(self):
+        """Test that the fill wraps the parsed color and alpha."""
+        assert rgba_to_solid_fill("#FF0000", 0.5) == {
+            "solidFill": {
+                "color": {"rgbColor": {"red": 1.0, "green": 0.0, "blue": 0.0}},
+                "alpha": 0.5,
+            }
+        }
+
+    def test_invalid_color(self):
+        """Test that invalid colors raise ValueError."""
+        with pytest.raises(ValueError):
+            rgba_to_solid_fill("#GG0000")
+
+    def test_from_preparsed_color(self):
+        """Test that a preparsed color gives the same fill without being shared."""
+        primary = preparsed_color("#FF0000")
+        fill = rgba_to_solid_fill_from_rgb(primary, 0.5)
+        assert fill == rgba_to_solid_fill("#FF0000", 0.5)
+        fill["solidFill"]["color"]["rgbColor"]["red"] = 0.0
+        assert primary["red"] == 1.0
@@ -0,0 +1,78 @@
+"""Tests for NumPy batch color conversion."""
+
+import pytest
+
+from google_slides_mcp.utils.colors import (
+    hex_to_rgb,
+    hex_to_rgb_batch,
+    rgb_to_hex,
+    rgb_to_hex_batch,
+)
+
+np = pytest.importorskip("numpy")
+
+
+class TestHexToRgbBatch:
+    """Tests for batch hex to RGB conversion."""
+
+    def test_matches_scalar_conversion(self):
+        """Test that batch results equal hex_to_rgb for every color."""
+        colors = ["#FF5733", "00ff00", "#F53", "#000000", "#FFFFFF", "#123abc"]
+        result = hex_to_rgb_batch(colors)
+        assert result.shape == (len(colors), 3)
+        for row, color in zip(result, colors):
+            rgb = hex_to_rgb(color)
+            assert tuple(row) == (rgb["red"], rgb["green"], rgb["blue"])
+
+    def test_all_byte_values_exact(self):
+        """Test that every component value matches the scalar path exactly."""
+        colors = [f"#{i:02X}{i:02X}{i:02X}" for i in range(256)]
+        result = hex_to_rgb_batch(colors)
+        assert np.array_equal(result[:, 0], np.arange(256) / 255)
+        assert result.dtype == np.float64
+
+    def test_empty(self):
+        """Test that an empty palette gives an empty array."""
+        assert hex_to_rgb_batch([]).shape == (0, 3)
+
+    @pytest.mark.parametrize(
+        "colors",
+        [["#FF0000", "invalid"], ["#GG0000"], ["#FFFF"]],
+    )
+    def test_invalid_color(self, colors):
+        """Test that any invalid color raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid hex color"):
+            hex_to_rgb_batch(colors)
+
+
+class TestRgbToHexBatch:
+    """Tests for batch RGB to hex conversion."""
+
+    def test_matches_scalar_conversion(self):
+        """Test that batch results equal rgb_to_hex for every row."""
+        values = np.array([[1.0, 0.0, 0.0], [0.2, 0.4, 0.6], [1 / 510, 0.5, 1.0], [0, 0, 0]])
+        expected = [rgb_to_hex(dict(zip(("red", "green", "blue"), row))) for row in values]
+        assert rgb_to_hex_batch(values) == expected
+
+    def test_hex_roundtrip(self):
+        """Test that hex -> RGB -> hex returns the original palette."""
+        palette = ["#FF5733", "#00FF00", "#123ABC", "#FFFFFF"]
+        assert rgb_to_hex_batch(hex_to_rgb_batch(palette)) == palette
+
+    def test_empty(self):
+        """Test that an empty array gives no colors."""
+        assert rgb_to_hex_batch(np.empty((0, 3))) == []
+
+    @pytest.mark.parametrize(
+        ("values", "match"),
+        [
+            ([[0.0, 0.5, 1.5]], "blue"),
+            ([[-0.1, 0.0, 0.0]], "red"),
+            ([[0.0, float("nan"), 0.0]], "green"),
+            ([[0.0, 0.0]], "shape"),
+        ],
+    )
+    def test_invalid(self, values, match):
+        """Test that bad shapes and out-of-range values raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            rgb_to_hex_batch(values)
@@ -0,0 +1,117 @@
+"""Tests for the presentation cache."""
+
+import pytest
+
+from google_slides_mcp.utils import presentation_cache
+from google_slides_mcp.utils.presentation_cache import (
+    get_element_index,
+    get_layouts_by_name,
+    get_presentation_cached,
+    invalidate_presentation,
+)
+
+
+class FakeSlidesService:
+    """Records get_presentation calls and serves a mutable presentation."""
+
+    def __init__(self, presentation: dict) -> None:
+        self.presentation = presentation
+        self.calls: list[str | None] = []
+
+    async def get_presentation(self, presentation_id: str, fields: str | None = None) -> dict:
+        self.calls.append(fields)
+        if fields == "revisionId":
+            return {"revisionId": self.presentation.get("revisionId")}
+        return dict(self.presentation)
+
+
+@pytest.fixture
+def service(sample_presentation_data) -> FakeSlidesService:
+    """Return a fake service for a presentation with a revision ID."""
+    return FakeSlidesService({**sample_presentation_data, "revisionId": "rev1"})
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Control the cache's clock."""
+
+    class Clock:
+        now = 1000.0
+
+    monkeypatch.setattr(presentation_cache.time, "monotonic", lambda: Clock.now)
+    return Clock
+
+
+class TestGetPresentationCached:
+    """Tests for get_presentation_cached."""
+
+    async def test_fresh_entry_is_reused(self, service, sample_presentation_id, clock):
+        first = await get_presentation_cached(service, sample_presentation_id)
+        second = await get_presentation_cached(service, sample_presentation_id)
+        assert second is first
+        assert service.calls == [None]
+
+    async def test_unchanged_revision_reuses_body(self, service, sample_presentation_id, clock):
+        first = await get_presentation_cached(service, sample_presentation_id)
+        clock.now += 10
+        second = await get_presentation_cached(service, sample_presentation_id)
+        assert second is first
+        assert service.calls == [None, "revisionId"]
+
+    async def test_changed_revision_refetches(self, service, sample_presentation_id, clock):
+        await get_presentation_cached(service, sample_presentation_id)
+        service.presentation["revisionId"] = "rev2"
+        clock.now += 10
+        body = await get_presentation_cached(service, sample_presentation_id)
+        assert body["revisionId"] == "rev2"
+        assert service.calls == [None, "revisionId", None]
+
+    async def test_missing_revision_refetches(self, service, sample_presentation_id, clock):
+        del service.presentation["revisionId"]
+        await get_presentation_cached(service, sample_presentation_id)
+        clock.now += 10
+        await get_presentation_cached(service, sample_presentation_id)
+        assert service.calls == [None, None]
+
+    async def test_services_do_not_share_entries(self, sample_presentation_data, clock):
+        first = FakeSlidesService(sample_presentation_data)
+        second = FakeSlidesService(sample_presentation_data)
+        await get_presentation_cached(first, "p")
+        await get_presentation_cached(second, "p")
+        assert first.calls == [None]
+        assert second.calls == [None]
+
+    async def test_invalidate_drops_entry(self, service, sample_presentation_id, clock):
+        await get_presentation_cached(service, sample_presentation_id)
+        invalidate_presentation(sample_presentation_id)
+        await get_presentation_cached(service, sample_presentation_id)
+        assert service.calls == [None, None]
+
+
+class TestGetElementIndex:
+    """Tests for get_element_index."""
+
+    async def test_indexes_slide_elements(self, service, sample_presentation_id, clock):
+        index = await get_element_index(service, sample_presentation_id)
+        assert list(index) == ["element_1"]
+        assert index["element_1"]["shape"]["shapeType"] == "TEXT_BOX"
+
+    async def test_index_built_once_per_fetch(self, service, sample_presentation_id, clock):
+        first = await get_element_index(service, sample_presentation_id)
+        second = await get_element_index(service, sample_presentation_id)
+        assert second is first
+        assert service.calls == [None]
+
+
+class TestGetLayoutsByName:
+    """Tests for get_layouts_by_name."""
+
+    async def test_first_layout_with_name_wins(self, service, sample_presentation_id, clock):
+        service.presentation["layouts"] = [
+            {"objectId": "l1", "layoutProperties": {"name": "Title_And_Body"}},
+            {"objectId": "l2", "layoutProperties": {"name": "TITLE_AND_BODY"}},
+            {"objectId": "l3", "layoutProperties": {"name": "BLANK"}},
+        ]
+        layouts = await get_layouts_by_name(service, sample_presentation_id)
+        assert layouts["TITLE_AND_BODY"]["objectId"] == "l1"
+        assert layouts["BLANK"]["objectId"] == "l3"
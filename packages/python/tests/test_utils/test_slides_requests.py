@@ -0,0 +1,49 @@
+"""Tests for typed Slides API request bodies."""
+
+import msgspec
+
+from google_slides_mcp.utils.slides_requests import (
+    CreateImageRequest,
+    CreateShapeRequest,
+    element_properties,
+)
+from google_slides_mcp.utils.transforms import build_absolute_transform, build_size
+
+
+class TestElementProperties:
+    """Tests for element placement request bodies."""
+
+    def test_matches_dict_helpers(self):
+        """Test that the Struct encodes like the dict-building helpers."""
+        props = element_properties("slide_1", 914400, 1828800, 3657600, 914400)
+        assert msgspec.to_builtins(props) == {
+            "pageObjectId": "slide_1",
+            "size": build_size(3657600, 914400),
+            "transform": build_absolute_transform(914400, 1828800),
+        }
+
+
+class TestCreateRequests:
+    """Tests for create request bodies."""
+
+    def test_create_shape_uses_camel_case(self):
+        """Test that createShape fields use the API's names."""
+        request = CreateShapeRequest(
+            object_id="shape_1",
+            shape_type="RECTANGLE",
+            element_properties=element_properties("slide_1", 0, 0, 1, 1),
+        )
+        encoded = msgspec.to_builtins(request)
+        assert encoded["objectId"] == "shape_1"
+        assert encoded["shapeType"] == "RECTANGLE"
+        assert encoded["elementProperties"]["pageObjectId"] == "slide_1"
+
+    def test_create_image_round_trips(self):
+        """Test that createImage encodes and decodes losslessly."""
+        request = CreateImageRequest(
+            object_id="image_1",
+            url="https://example.com/a.png",
+            element_properties=element_properties("slide_1", 10, 20, 30, 40),
+        )
+        decoded = msgspec.json.decode(msgspec.json.encode(request), type=CreateImageRequest)
+        assert decoded == request
@@ -0,0 +1,94 @@
+"""Tests for transform calculation utilities."""
+
+import pytest
+
+from google_slides_mcp.utils.transforms import (
+    SLIDE_SIZES,
+    SlideSize,
+    build_absolute_transform,
+    calculate_alignment_position,
+)
+
+SLIDE = SLIDE_SIZES["16:9"]
+
+
+class TestSlideSize:
+    """Tests for the SlideSize dataclass."""
+
+    def test_inches(self):
+        """Test inch conversions of a predefined size."""
+        assert SLIDE.width_inches == 10.0
+        assert SLIDE.height_inches == 5.625
+
+    def test_immutable(self):
+        """Test that dimensions cannot change after inches are cached."""
+        size = SlideSize(914400, 914400)
+        assert size.width_inches == 1.0
+        with pytest.raises(AttributeError):
+            size.width_emu = 0
+
+    def test_slots(self):
+        """Test that instances use slots rather than a per-instance dict."""
+        assert not hasattr(SLIDE, "__dict__")
+
+    def test_equality_ignores_derived_fields(self):
+        """Test that sizes compare and hash by their EMU dimensions."""
+        assert SlideSize(9144000, 5143500) == SLIDE
+        assert hash(SlideSize(9144000, 5143500)) == hash(SLIDE)
+        assert repr(SLIDE) == "SlideSize(width_emu=9144000, height_emu=5143500)"
+
+
+class TestAlignmentPosition:
+    """Tests for alignment-based positioning."""
+
+    @pytest.mark.parametrize(
+        ("horizontal", "expected_x"),
+        [("left", 100), ("center", 4072000), ("right", 8143900), (None, 0)],
+    )
+    def test_horizontal(self, horizontal, expected_x):
+        """Test each horizontal alignment."""
+        x, _ = calculate_alignment_position(
+            SLIDE, 1000000, 500000, horizontal=horizontal, margin_emu=100
+        )
+        assert x == expected_x
+
+    @pytest.mark.parametrize(
+        ("vertical", "expected_y"),
+        [("top", 100), ("center", 2321750), ("bottom", 4643400), (None, 0)],
+    )
+    def test_vertical(self, vertical, expected_y):
+        """Test each vertical alignment."""
+        _, y = calculate_alignment_position(
+            SLIDE, 1000000, 500000, vertical=vertical, margin_emu=100
+        )
+        assert y == expected_y
+
+    def test_unknown_alignment_is_unaligned(self):
+        """Test that an unrecognized alignment keeps the element at the edge."""
+        assert calculate_alignment_position(SLIDE, 10, 10, "middle", "middle") == (0, 0)
+
+
+class TestBuildAbsoluteTransform:
+    """Tests for absolute transform construction."""
+
+    def test_transform(self):
+        """Test translation and scale are set on an unsheared transform."""
+        assert build_absolute_transform(100, 200, scale_x=2.0) == {
+            "scaleX": 2.0,
+            "scaleY": 1.0,
+            "shearX": 0,
+            "shearY": 0,
+            "translateX": 100,
+            "translateY": 200,
+            "unit": "EMU",
+        }
+
+    def test_returns_independent_dicts(self):
+        """Test that modifying a result doesn't affect later transforms."""
+        build_absolute_transform(1, 1)["shearX"] = 5
+        assert build_absolute_transform(1, 1)["shearX"] == 0
+
+    def test_rotation_not_supported(self):
+        """Test that a non-zero rotation raises NotImplementedError."""
+        with pytest.raises(NotImplementedError):
+            build_absolute_transform(0, 0, rotation_angle=45)
@@ -0,0 +1,93 @@
+"""Tests for NumPy batch transform calculations."""
+
+import pytest
+
+from google_slides_mcp.utils import transforms
+from google_slides_mcp.utils.transforms import (
+    SLIDE_SIZES,
+    build_size,
+    build_sizes_batch,
+    calculate_center_position,
+    calculate_center_positions_batch,
+    extract_all_element_bounds,
+    extract_element_bounds,
+)
+
+np = pytest.importorskip("numpy")
+
+SLIDE = SLIDE_SIZES["16:9"]
+WIDTHS = [0, 1000000, 3000001, 9144000, 10000000]
+HEIGHTS = [0, 500000, 1, 5143500, 6000001]
+
+
+class TestCenterPositionsBatch:
+    """Tests for batch centering."""
+
+    def expected(self):
+        return [list(calculate_center_position(SLIDE, w, h)) for w, h in zip(WIDTHS, HEIGHTS)]
+
+    def test_matches_scalar(self):
+        """Test that batch positions equal calculate_center_position."""
+        result = calculate_center_positions_batch(SLIDE, WIDTHS, HEIGHTS)
+        assert result.dtype == np.int64
+        assert result.tolist() == self.expected()
+
+    def test_without_numba(self, monkeypatch):
+        """Test the vectorized NumPy fallback gives the same positions."""
+        monkeypatch.setattr(transforms, "_center_positions_kernel", lambda: None)
+        result = calculate_center_positions_batch(SLIDE, WIDTHS, HEIGHTS)
+        assert result.tolist() == self.expected()
+
+    def test_kernel_in_python(self):
+        """Test the loop kernel itself when run uncompiled."""
+        out = np.empty((len(WIDTHS), 2), dtype=np.int64)
+        transforms._center_positions_impl(
+            SLIDE.width_emu, SLIDE.height_emu, np.array(WIDTHS), np.array(HEIGHTS), out
+        )
+        assert out.tolist() == self.expected()
+
+    def test_mismatched_lengths(self):
+        """Test that widths and heights must pair up."""
+        with pytest.raises(ValueError):
+            calculate_center_positions_batch(SLIDE, [1, 2], [1])
+
+
+class TestExtractAllElementBounds:
+    """Tests for batch bounds extraction."""
+
+    ELEMENTS = [
+        {
+            "size": {"width": {"magnitude": 3000000}, "height": {"magnitude": 3000000}},
+            "transform": {"scaleX": 0.5, "scaleY": -2, "translateX": 100.0, "translateY": 200},
+        },
+        {
+            "size": {"width": {"magnitude": 100}, "height": {"magnitude": 50}},
+            "transform": {"translateX": 7},
+        },
+    ]
+
+    def test_matches_scalar(self):
+        """Test that each row equals extract_element_bounds."""
+        result = extract_all_element_bounds(self.ELEMENTS)
+        assert result.dtype == np.int64
+        assert result.tolist() == [list(extract_element_bounds(e)) for e in self.ELEMENTS]
+
+    def test_empty(self):
+        """Test that no elements gives an empty (0, 4) array."""
+        assert extract_all_element_bounds([]).shape == (0, 4)
+
+    def test_missing_transform(self):
+        """Test that an element without a transform raises ValueError."""
+        with pytest.raises(ValueError):
+            extract_all_element_bounds([*self.ELEMENTS, {"size": {}}])
+
+
+class TestBuildSizesBatch:
+    """Tests for batch size construction."""
+
+    def test_matches_scalar(self):
+        """Test that each size equals build_size with plain ints."""
+        dims = np.array([[100, 200], [914400, 457200]])
+        result = build_sizes_batch(dims)
+        assert result == [build_size(100, 200), build_size(914400, 457200)]
+        assert type(result[0]["width"]["magnitude"]) is int
@@ -27,6 +27,10 @@ class TestInchesConversion:
         assert emu_to_inches(9144000) == 10.0
         assert emu_to_inches(0) == 0.0
 
+    def test_emu_to_inches_correctly_rounded(self):
+        """Test that fractional inches are not off by an ulp."""
+        assert emu_to_inches(182880) == 0.2
+
     def test_roundtrip(self):
         """Test that conversion roundtrips correctly."""
         original = 5.5
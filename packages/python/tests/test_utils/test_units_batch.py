@@ -0,0 +1,48 @@
+"""Tests for NumPy batch unit conversion."""
+
+import pytest
+
+from google_slides_mcp.utils.units import (
+    cm_to_emu,
+    cm_to_emu_array,
+    inches_to_emu,
+    inches_to_emu_array,
+    pixels_to_emu,
+    pixels_to_emu_array,
+    points_to_emu,
+    points_to_emu_array,
+)
+
+np = pytest.importorskip("numpy")
+
+VALUES = [0.0, 0.5, 1.0, 1.3, 2.54, 10.0, 13.333, -0.75]
+
+
+@pytest.mark.parametrize(
+    ("batch", "scalar"),
+    [
+        (inches_to_emu_array, inches_to_emu),
+        (points_to_emu_array, points_to_emu),
+        (cm_to_emu_array, cm_to_emu),
+        (pixels_to_emu_array, pixels_to_emu),
+    ],
+)
+def test_matches_scalar_conversion(batch, scalar):
+    """Test that batch conversions equal the scalar functions elementwise."""
+    result = batch(VALUES)
+    assert result.dtype == np.int64
+    assert result.tolist() == [scalar(v) for v in VALUES]
+
+
+def test_pixels_custom_dpi():
+    """Test pixel conversion at a non-default DPI."""
+    assert pixels_to_emu_array(VALUES, dpi=72).tolist() == [
+        pixels_to_emu(v, dpi=72) for v in VALUES
+    ]
+
+
+def test_preserves_shape():
+    """Test that multi-dimensional input keeps its shape."""
+    result = inches_to_emu_array(np.ones((4, 2)))
+    assert result.shape == (4, 2)
+    assert (result == 914400).all()